@@ -1,9 +1,16 @@
 import os
+import queue
+import threading
 import time
 import json
 import requests
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json still works
+    orjson = None
+
 from collector.metrics_collector import stream_metrics
 from features.windowing import SlidingWindow
 from features.feature_engineering import build_feature_vector
@@ -31,11 +38,50 @@ detector = LiveAnomalyDetector()
 RUNTIME_DIR = Path(os.getenv("SMARTOPS_RUNTIME_DIR", "/app/data/runtime"))
 RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
 
+LATEST_DETECTION_FILE = RUNTIME_DIR / "latest_detection.json"
+LATEST_RISK_FILE = RUNTIME_DIR / "latest_risk.json"
+
 window_count = 0
 clean_counter = 0
 anomaly_state = False
 last_sent_state = False  # Prevent duplicate signal spam
 
+# ===================================
+# BACKGROUND RUNTIME-FILE WRITER
+# ===================================
+# Dashboard status files are written off the detection thread so the
+# main loop never blocks on file I/O. Writes go tmp + os.replace so
+# readers never see a half-written file.
+_write_queue = queue.Queue(maxsize=64)
+
+
+def _runtime_writer():
+    while True:
+        path, payload = _write_queue.get()
+        try:
+            if orjson is not None:
+                data = orjson.dumps(payload)
+            else:
+                data = json.dumps(payload).encode()
+
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except Exception as e:
+            print("[WARN] Runtime file write failed:", e)
+
+
+threading.Thread(target=_runtime_writer, daemon=True).start()
+
+
+def write_runtime_file(path, payload):
+    try:
+        _write_queue.put_nowait((path, payload))
+    except queue.Full:
+        # Stale status updates are droppable; next tick overwrites anyway
+        pass
+
 # ===================================
 # HELPER: Send anomaly to orchestrator
 # ===================================
@@ -79,18 +125,34 @@ def main():
     print(f"[INFO] Running PROFILE={PROFILE}")
     print(f"[INFO] Orchestrator URL={ORCH_URL}")
 
+    last_window_key = None
+
     for ts, metrics in stream_metrics():
         window_60s.add(ts, metrics)
 
         if not window_60s.is_ready():
             continue
 
+        # -------------------------------
+        # SKIP DUPLICATE WINDOWS
+        # -------------------------------
+        # If the poll produced no new data (same length and same
+        # head/tail timestamps), re-running detection is wasted work.
+        window_key = (
+            len(window_60s),
+            window_60s.first_ts(),
+            window_60s.last_ts(),
+        )
+        if window_key == last_window_key:
+            continue
+        last_window_key = window_key
+
         window_count += 1
 
         # -------------------------------
         # Feature Engineering
         # -------------------------------
-        features = build_feature_vector(window_60s.values())
+        features = build_feature_vector(window_60s)
         if not features:
             continue
 
@@ -158,8 +220,12 @@ def main():
         # -------------------------------
         # CONSOLE OUTPUT
         # -------------------------------
+        # One clock read + one format per tick, reused below
+        now = time.time()
+        hms = time.strftime("%H:%M:%S", time.localtime(now))
+
         print("\n--- LIVE DETECTION ---")
-        print(f"Time: {time.strftime('%H:%M:%S')}")
+        print(f"Time: {hms}")
         print(f"Profile: {PROFILE}")
         print(f"Anomaly Detected: {anomaly_final}")
         print(f"  Statistical: {stat_result}")
@@ -169,27 +235,25 @@ def main():
         # -------------------------------
         # SAVE: LIVE DETECTION STATUS
         # -------------------------------
-        with open(RUNTIME_DIR / "latest_detection.json", "w") as f:
-            json.dump({
-                "timestamp": time.time(),
-                "profile": PROFILE,
-                "anomaly": anomaly_final,
-                "statistical": stat_result,
-                "isolation_forest": iso_result,
-                "recovering": anomaly_state and not raw_anomaly,
-                "recovery_windows": clean_counter,
-                "required_recovery_windows": RECOVERY_WINDOWS
-            }, f, indent=2)
+        write_runtime_file(LATEST_DETECTION_FILE, {
+            "timestamp": now,
+            "profile": PROFILE,
+            "anomaly": anomaly_final,
+            "statistical": stat_result,
+            "isolation_forest": iso_result,
+            "recovering": anomaly_state and not raw_anomaly,
+            "recovery_windows": clean_counter,
+            "required_recovery_windows": RECOVERY_WINDOWS
+        })
 
         # -------------------------------
         # SAVE: RISK STATUS
         # -------------------------------
-        with open(RUNTIME_DIR / "latest_risk.json", "w") as f:
-            json.dump({
-                "risk": risk,
-                "timestamp": time.time(),
-                "profile": PROFILE
-            }, f, indent=2)
+        write_runtime_file(LATEST_RISK_FILE, {
+            "risk": risk,
+            "timestamp": now,
+            "profile": PROFILE
+        })
         # -------------------------------
         # Service + type mapping (production)
         # -------------------------------
@@ -212,8 +276,6 @@ def main():
         if not anomaly_final:
             last_sent_state = False
 
-        time.sleep(1)
-
 
 # ===================================
 # ENTRY POINT
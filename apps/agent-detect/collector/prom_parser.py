@@ -1,25 +1,40 @@
 import re
 
+# Bytes-mode, multi-line scan over the whole scrape body: one C-level
+# pass instead of splitting and inspecting thousands of lines in
+# Python. Comment and blank lines simply never match. Bytes mode also
+# means the response body needs no UTF-8 decode first.
 METRIC_LINE = re.compile(
-    r'^([a-zA-Z_:][a-zA-Z0-9_:]*)'
-    r'(?:\{.*?\})?\s+([-+]?[0-9]*\.?[0-9eE+-]+)$'
+    rb'(?m)^([a-zA-Z_:][\w:]*)'
+    rb'(?:\{[^}]*\})?[ \t]+([-+]?[0-9]*\.?[0-9eE+-]+)[ \t]*$'
 )
 
-def parse_prometheus_text(text: str) -> dict:
+
+def parse_prometheus_text(text, wanted=None) -> dict:
     """
     Parse Prometheus exposition format into {metric_name: value}
+
+    Accepts str or bytes (bytes preferred: pass response.content to
+    skip the UTF-8 decode). If `wanted` is given (a set of metric
+    names), all other samples are skipped before the value is parsed.
+    For labeled duplicates the first sample wins.
     """
+    if isinstance(text, str):
+        text = text.encode()
+
     metrics = {}
 
-    for line in text.splitlines():
-        if not line or line.startswith("#"):
-            continue
+    for match in METRIC_LINE.finditer(text):
+        name = match.group(1).decode()
 
-        match = METRIC_LINE.match(line)
-        if not match:
+        if wanted is not None and name not in wanted:
+            continue
+        if name in metrics:
             continue
 
-        name, value = match.groups()
-        metrics[name] = float(value)
+        try:
+            metrics[name] = float(match.group(2))
+        except ValueError:
+            continue
 
     return metrics
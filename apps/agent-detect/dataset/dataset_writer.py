@@ -1,3 +1,4 @@
+import atexit
 import csv
 import os
 from datetime import datetime
@@ -5,11 +6,27 @@ from datetime import datetime
 DATASET_DIR = "data/datasets"
 DATASET_FILE = os.path.join(DATASET_DIR, "features.csv")
 
+FLUSH_EVERY_ROWS = 100
+
+
 class DatasetWriter:
+    """
+    Append-only CSV writer with a persistent file handle.
+
+    The file is opened once and rows are flushed in batches instead of
+    re-opening / closing the file for every single row.
+    """
+
     def __init__(self):
         os.makedirs(DATASET_DIR, exist_ok=True)
         self.file_exists = os.path.exists(DATASET_FILE)
 
+        self.f = open(DATASET_FILE, "a", newline="", buffering=1 << 16)
+        self.writer = None
+        self._rows_since_flush = 0
+
+        atexit.register(self.close)
+
     def write(self, timestamp, features, label):
         row = {
             "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
@@ -17,11 +34,22 @@ class DatasetWriter:
             "label": label
         }
 
-        with open(DATASET_FILE, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=row.keys())
+        # Fieldnames are resolved from the first row and kept stable
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.f, fieldnames=row.keys())
 
             if not self.file_exists:
-                writer.writeheader()
+                self.writer.writeheader()
                 self.file_exists = True
 
-            writer.writerow(row)
+        self.writer.writerow(row)
+
+        self._rows_since_flush += 1
+        if self._rows_since_flush >= FLUSH_EVERY_ROWS:
+            self.f.flush()
+            self._rows_since_flush = 0
+
+    def close(self):
+        if not self.f.closed:
+            self.f.flush()
+            self.f.close()
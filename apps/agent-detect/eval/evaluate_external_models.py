@@ -1,6 +1,5 @@
 import sys
 import os
-import csv
 
 # ---------------------------------------------------
 # Fix Python path
@@ -10,6 +9,9 @@ BASE_DIR = os.path.abspath(
 )
 sys.path.insert(0, BASE_DIR)
 
+import numpy as np
+import pandas as pd
+
 from models.stats_baseline import StatisticalBaseline
 from models.isolation_forest import IsolationForestModel
 
@@ -17,17 +19,15 @@ DATASET_FILE = "data/datasets/aws_external_features.csv"
 
 # ---------------------------------------------------
 def load_external_dataset():
-    X, y = [], []
-
-    with open(DATASET_FILE) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            label = int(row.pop("label"))
-            row.pop("source")  # not a feature
-            X.append({k: float(v) for k, v in row.items()})
-            y.append(label)
+    """
+    One C-level CSV parse instead of a per-cell DictReader float() loop.
+    Returns (X, y, feature_keys) with X as contiguous float32.
+    """
+    df = pd.read_csv(DATASET_FILE)
+    y = df.pop("label").to_numpy(np.int8)
+    df.pop("source")  # not a feature
 
-    return X, y
+    return df.to_numpy(np.float32), y, tuple(df.columns)
 
 # ---------------------------------------------------
 def confusion_matrix(y_true, y_pred):
@@ -45,24 +45,30 @@ def recall(tp, fn):
 
 # ---------------------------------------------------
 def evaluate():
-    X, y = load_external_dataset()
+    X, y, feature_keys = load_external_dataset()
 
-    print(f"[INFO] Loaded {len(X)} AWS external samples")
+    # SIMD label counts instead of a Python row loop
+    label_counts = np.bincount(y, minlength=2)
+    print(
+        f"[INFO] Loaded {len(X)} AWS external samples "
+        f"(normal={int(label_counts[0])}, anomaly={int(label_counts[1])})"
+    )
 
     # -------------------------------
     # Train models
     # -------------------------------
     stats = StatisticalBaseline()
-    stats.fit(X)
+    stats.fit(X, keys=feature_keys)
 
     iso = IsolationForestModel()
-    iso.fit([list(x.values()) for x in X])
+    iso.fit(X)
 
     # -------------------------------
-    # Predict
+    # Predict (vectorized over the whole dataset)
     # -------------------------------
-    y_pred_stats = [int(stats.predict(x)) for x in X]
-    y_pred_iso = [int(iso.predict(list(x.values()))) for x in X]
+    z = np.abs(X - stats.mean) * stats.inv_std
+    y_pred_stats = (z.max(axis=1) > stats.z_threshold).astype(int)
+    y_pred_iso = iso.predict_batch(X).astype(int)
 
     # -------------------------------
     # Report
@@ -7,7 +7,9 @@ BASE_DIR = os.path.abspath(
 )
 sys.path.insert(0, BASE_DIR)
 
-import csv
+import numpy as np
+import pandas as pd
+
 from models.stats_baseline import StatisticalBaseline
 from models.isolation_forest import IsolationForestModel
 
@@ -15,17 +17,15 @@ from models.isolation_forest import IsolationForestModel
 DATASET_FILE = "data/datasets/features.csv"
 
 def load_dataset():
-    X, y = [], []
-
-    with open(DATASET_FILE) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            label = int(row.pop("label"))
-            row.pop("timestamp")
-            X.append({k: float(v) for k, v in row.items()})
-            y.append(label)
+    """
+    One C-level CSV parse instead of a per-cell DictReader float() loop.
+    Returns (X, y, feature_keys) with X as contiguous float32.
+    """
+    df = pd.read_csv(DATASET_FILE)
+    y = df.pop("label").to_numpy(np.int8)
+    df.pop("timestamp")
 
-    return X, y
+    return df.to_numpy(np.float32), y, tuple(df.columns)
 
 def confusion_matrix(y_true, y_pred):
     tp = sum(1 for yt, yp in zip(y_true, y_pred) if yt == 1 and yp == 1)
@@ -41,18 +41,19 @@ def recall(tp, fn):
     return tp / (tp + fn) if (tp + fn) else 0.0
 
 def evaluate():
-    X, y = load_dataset()
+    X, y, feature_keys = load_dataset()
 
     # Train models
     stats = StatisticalBaseline()
-    stats.fit(X)
+    stats.fit(X, keys=feature_keys)
 
     iso = IsolationForestModel()
-    iso.fit([list(x.values()) for x in X])
+    iso.fit(X)
 
-    # Predictions
-    y_pred_stats = [int(stats.predict(x)) for x in X]
-    y_pred_iso = [int(iso.predict(list(x.values()))) for x in X]
+    # Predictions (vectorized over the whole dataset)
+    z = np.abs(X - stats.mean) * stats.inv_std
+    y_pred_stats = (z.max(axis=1) > stats.z_threshold).astype(int)
+    y_pred_iso = iso.predict_batch(X).astype(int)
 
     # Metrics
     for name, preds in [
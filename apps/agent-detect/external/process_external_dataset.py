@@ -1,6 +1,7 @@
 import sys
 import os
 import csv
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
 # ---------------------------------------------------
@@ -43,8 +44,14 @@ def parse_timestamp(ts):
         return datetime.strptime(ts, "%Y-%m-%d %H:%M:%S").timestamp()
 
 # ---------------------------------------------------
-def process_file(filepath, source_name, writer):
+def process_file(filepath, source_name):
+    """
+    Extract feature records from one CSV file.
+    Returns the records instead of writing, so files can be processed
+    in parallel worker processes.
+    """
     window = SlidingWindow(WINDOW_SIZE_SECONDS)
+    records = []
 
     with open(filepath) as f:
         reader = csv.DictReader(f)
@@ -64,7 +71,9 @@ def process_file(filepath, source_name, writer):
                     record = {k: feats[k] for k in FEATURE_KEYS}
                     record["label"] = label
                     record["source"] = source_name
-                    writer.writerow(record)
+                    records.append(record)
+
+    return records
 
 # ---------------------------------------------------
 def main():
@@ -81,15 +90,25 @@ def main():
 
     fieldnames = FEATURE_KEYS + ["label", "source"]
 
+    # Each file is an independent CPU-bound extraction: fan out to
+    # worker processes and serialize results in the main process
     with open(OUTPUT_CSV, "w", newline="") as out:
         writer = csv.DictWriter(out, fieldnames=fieldnames)
         writer.writeheader()
 
-        for filename in files:
-            filepath = os.path.join(INPUT_DIR, filename)
-            source_name = filename.replace(".csv", "")
-            print(f"[PROCESSING] {filename}")
-            process_file(filepath, source_name, writer)
+        with ProcessPoolExecutor() as executor:
+            futures = {
+                executor.submit(
+                    process_file,
+                    os.path.join(INPUT_DIR, filename),
+                    filename.replace(".csv", ""),
+                ): filename
+                for filename in files
+            }
+
+            for future in as_completed(futures):
+                print(f"[PROCESSED] {futures[future]}")
+                writer.writerows(future.result())
 
     print(f"[OK] AWS external features saved to {OUTPUT_CSV}")
 
@@ -0,0 +1,72 @@
+"""
+Numerical kernels for feature extraction.
+
+When Numba is available the window reduction is JIT-compiled into a
+single fused native pass (one traversal computes mean, std, min, max,
+slope and spike for every metric column). Without Numba the same
+signature falls back to plain NumPy reductions, so the dependency
+stays optional.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+def _feats_numpy(mat):
+    mean = mat.mean(axis=0)
+    std = mat.std(axis=0)
+    minimum = mat.min(axis=0)
+    maximum = mat.max(axis=0)
+    slope = mat[-1] - mat[0]
+    spike = np.abs(mat - mean).max(axis=0)
+    return mean, std, minimum, maximum, slope, spike
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _feats(mat):
+        n, m = mat.shape
+        mean = np.empty(m)
+        std = np.empty(m)
+        minimum = np.empty(m)
+        maximum = np.empty(m)
+        slope = np.empty(m)
+        spike = np.empty(m)
+
+        for j in range(m):
+            s = 0.0
+            s2 = 0.0
+            mn = mat[0, j]
+            mx = mat[0, j]
+
+            for i in range(n):
+                v = mat[i, j]
+                s += v
+                s2 += v * v
+                if v < mn:
+                    mn = v
+                if v > mx:
+                    mx = v
+
+            mu = s / n
+            var = s2 / n - mu * mu
+
+            mean[j] = mu
+            std[j] = var ** 0.5 if var > 0.0 else 0.0
+            minimum[j] = mn
+            maximum[j] = mx
+            slope[j] = mat[n - 1, j] - mat[0, j]
+            spike[j] = max(mx - mu, mu - mn)
+
+        return mean, std, minimum, maximum, slope, spike
+
+    # Prewarm so the JIT cost is paid at import, not on the first window
+    _feats(np.zeros((2, 1), dtype=np.float64))
+
+else:
+    _feats = _feats_numpy
@@ -3,6 +3,14 @@ import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json still works
+    orjson = None
+
+from features.windowing import SlidingWindow
+from features._kernels import _feats
+
 # Single source of truth for runtime output (dashboard uses this)
 RUNTIME_DIR = Path(os.getenv("SMARTOPS_RUNTIME_DIR", "/app/data/runtime"))
 RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
@@ -31,72 +39,94 @@ ODOO_METRICS = [
 ]
 
 
-def extract_metric_series(window_values, metric_name):
-    """
-    Extract a time-series list for a single metric from window data.
-    Keeps only entries that contain the key (avoid artificial zeros).
-    """
-    return [
-        entry.get(metric_name, 0.0)
-        for entry in window_values
-        if metric_name in entry
-    ]
+FEATURE_NAMES = ("mean", "std", "min", "max", "slope", "spike")
 
 
-def compute_features(series):
+def build_feature_vector(window_values, metrics=None):
     """
-    Compute statistical & temporal features from a numeric series.
+    Build full feature vector for selected metrics in a single pass.
+    Also saves latest feature vector for dashboard & prediction preview.
+
+    Accepts either a SlidingWindow (preferred: consumes its O(1)
+    incremental stats, no per-tick recompute) or a raw list of metric
+    dicts, in which case all metrics are packed into one
+    (window, metric) matrix and reduced column-wise.
     """
-    if len(series) < 2:
-        return None
+    if metrics is None:
+        metrics = ODOO_METRICS if PROFILE == "odoo" else SIMULATOR_METRICS
+
+    if isinstance(window_values, SlidingWindow):
+        feature_vector = {}
+        stats = window_values.stats()
+
+        for metric in metrics:
+            if metric not in stats:
+                continue
+
+            mean, std, minimum, maximum, first, last = stats[metric]
+            feature_vector[f"{metric}_mean"] = mean
+            feature_vector[f"{metric}_std"] = std
+            feature_vector[f"{metric}_min"] = minimum
+            feature_vector[f"{metric}_max"] = maximum
+            feature_vector[f"{metric}_slope"] = last - first
+            # Max deviation from mean lies at one of the extremes
+            feature_vector[f"{metric}_spike"] = max(maximum - mean, mean - minimum)
+
+        _save_latest_features(feature_vector)
+        return feature_vector
+
+    if not isinstance(window_values, (list, tuple)):
+        window_values = list(window_values)
+
+    n = len(window_values)
+    if n < 2:
+        return {}
+
+    # AoS -> SoA: one matrix build, then column-wise reductions
+    mat = np.empty((n, len(metrics)), dtype=np.float64)
+    for i, entry in enumerate(window_values):
+        for j, metric in enumerate(metrics):
+            mat[i, j] = entry.get(metric, 0.0)
 
-    arr = np.array(series, dtype=float)
+    feature_vector = {}
+    stats = _feats(mat)
+
+    for j, metric in enumerate(metrics):
+        for key, column in zip(FEATURE_NAMES, stats):
+            feature_vector[f"{metric}_{key}"] = float(column[j])
 
-    mean = float(np.mean(arr))
-    std = float(np.std(arr))
-    minimum = float(np.min(arr))
-    maximum = float(np.max(arr))
+    _save_latest_features(feature_vector)
+    return feature_vector
 
-    # Trend (simple slope)
-    slope = float(arr[-1] - arr[0])
 
-    # Spike detection (max deviation from mean)
-    spike = float(np.max(np.abs(arr - mean)))
+# Preview file is refreshed every Nth window, not every tick
+_SAVE_EVERY_TICKS = 5
+_ticks = 0
 
-    return {
-        "mean": mean,
-        "std": std,
-        "min": minimum,
-        "max": maximum,
-        "slope": slope,
-        "spike": spike,
-    }
+LATEST_FEATURES_FILE = RUNTIME_DIR / "latest_features.json"
+_LATEST_FEATURES_TMP = RUNTIME_DIR / "latest_features.json.tmp"
 
 
-def build_feature_vector(window_values):
+def _save_latest_features(feature_vector):
     """
-    Build full feature vector for selected metrics.
-    Also saves latest feature vector for dashboard & prediction preview.
+    Save latest features (dashboard & prediction preview).
+    Throttled to every few ticks and swapped in atomically so readers
+    never see a partial file.
     """
-    metrics = ODOO_METRICS if PROFILE == "odoo" else SIMULATOR_METRICS
-
-    feature_vector = {}
-
-    for metric in metrics:
-        series = extract_metric_series(window_values, metric)
-        features = compute_features(series)
+    global _ticks
 
-        if not features:
-            continue
+    if not feature_vector:
+        return
 
-        for key, value in features.items():
-            feature_vector[f"{metric}_{key}"] = value
+    _ticks += 1
+    if _ticks % _SAVE_EVERY_TICKS != 1:
+        return
 
-    # -------------------------------
-    # SAVE latest features (dashboard & prediction preview)
-    # -------------------------------
-    if feature_vector:
-        with open(RUNTIME_DIR / "latest_features.json", "w") as f:
-            json.dump(feature_vector, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(feature_vector)
+    else:
+        data = json.dumps(feature_vector).encode()
 
-    return feature_vector
\ No newline at end of file
+    with open(_LATEST_FEATURES_TMP, "wb") as f:
+        f.write(data)
+    os.replace(_LATEST_FEATURES_TMP, LATEST_FEATURES_FILE)
\ No newline at end of file
@@ -1,21 +1,204 @@
-import time
+import math
+from array import array
 from collections import deque
 
+import numpy as np
+
+
 class SlidingWindow:
-    def __init__(self, window_size_seconds: int):
+    """
+    Time-based sliding window with incremental per-metric statistics.
+
+    Storage is columnar: one array('d') ring per metric plus one for
+    timestamps, instead of a deque of (timestamp, dict) tuples. Samples
+    are raw contiguous doubles, so the window costs 8 bytes per value
+    and feeds NumPy without conversion.
+
+    Each add/evict updates running sum / sum-of-squares and monotonic
+    min/max deques (Lemire-style), so stats() is O(1) per metric per
+    tick instead of a full window recompute.
+
+    Metric columns are discovered on first sight; a metric missing
+    from a sample is stored as 0.0 so columns stay aligned.
+    """
+
+    def __init__(self, window_size_seconds: int, metrics=None, capacity: int = 256):
         self.window_size = window_size_seconds
-        self.buffer = deque()
+        self.cap = capacity
+
+        self.ts = array("d", bytes(8 * capacity))
+        self.cols = {}
+
+        self._added = 0    # absolute index of next sample
+        self._evicted = 0  # absolute index of oldest live sample
+        self._sum = {}
+        self._sumsq = {}
+        self._minq = {}    # monotonic increasing deque of (idx, value)
+        self._maxq = {}    # monotonic decreasing deque of (idx, value)
+
+        if metrics:
+            for metric in metrics:
+                self._add_column(metric)
+
+    def __len__(self):
+        return self._added - self._evicted
+
+    def _add_column(self, metric):
+        col = array("d", bytes(8 * self.cap))
+
+        # Backfill zeros for already-live samples so columns line up;
+        # zeros contribute nothing to the sums, and one (idx, 0.0)
+        # entry stands in for them in the monotonic deques.
+        self.cols[metric] = col
+        self._sum[metric] = 0.0
+        self._sumsq[metric] = 0.0
+        self._minq[metric] = deque()
+        self._maxq[metric] = deque()
+
+        if len(self) > 0:
+            last = self._added - 1
+            self._minq[metric].append((last, 0.0))
+            self._maxq[metric].append((last, 0.0))
+
+    def _grow(self):
+        # Unroll each ring into a doubled buffer, oldest-first
+        new_cap = self.cap * 2
+        n = len(self)
+        start = self._evicted
+
+        def unroll(ring):
+            fresh = array("d", bytes(8 * new_cap))
+            for i in range(n):
+                fresh[(start + i) % new_cap] = ring[(start + i) % self.cap]
+            return fresh
+
+        self.ts = unroll(self.ts)
+        for metric in self.cols:
+            self.cols[metric] = unroll(self.cols[metric])
+
+        self.cap = new_cap
 
     def add(self, timestamp: float, data: dict):
-        self.buffer.append((timestamp, data))
+        if len(self) == self.cap:
+            self._grow()
+
+        idx = self._added
+        slot = idx % self.cap
+        self.ts[slot] = timestamp
+
+        for metric in data:
+            if metric not in self.cols:
+                self._add_column(metric)
+
+        for metric, col in self.cols.items():
+            value = data.get(metric, 0.0)
+            col[slot] = value
+
+            self._sum[metric] += value
+            self._sumsq[metric] += value * value
+
+            minq = self._minq[metric]
+            while minq and minq[-1][1] >= value:
+                minq.pop()
+            minq.append((idx, value))
+
+            maxq = self._maxq[metric]
+            while maxq and maxq[-1][1] <= value:
+                maxq.pop()
+            maxq.append((idx, value))
+
+        self._added = idx + 1
         self._cleanup(timestamp)
 
     def _cleanup(self, now: float):
-        while self.buffer and now - self.buffer[0][0] > self.window_size:
-            self.buffer.popleft()
+        while len(self) > 0 and now - self.ts[self._evicted % self.cap] > self.window_size:
+            idx = self._evicted
+            slot = idx % self.cap
+
+            for metric, col in self.cols.items():
+                value = col[slot]
+                self._sum[metric] -= value
+                self._sumsq[metric] -= value * value
+
+                minq = self._minq[metric]
+                if minq and minq[0][0] == idx:
+                    minq.popleft()
+
+                maxq = self._maxq[metric]
+                if maxq and maxq[0][0] == idx:
+                    maxq.popleft()
+
+            self._evicted = idx + 1
+
+    def first_ts(self):
+        return self.ts[self._evicted % self.cap]
+
+    def last_ts(self):
+        return self.ts[(self._added - 1) % self.cap]
+
+    def stats(self):
+        """
+        Return {metric: (mean, std, min, max, first, last)} in O(1)
+        per metric. Skipped entirely when fewer than 2 live samples.
+        """
+        n = len(self)
+        if n < 2:
+            return {}
+
+        first_slot = self._evicted % self.cap
+        last_slot = (self._added - 1) % self.cap
+        result = {}
+
+        for metric, col in self.cols.items():
+            mean = self._sum[metric] / n
+            # Guard against tiny negative variance from float cancellation
+            var = self._sumsq[metric] / n - mean * mean
+            std = math.sqrt(var) if var > 0.0 else 0.0
+
+            result[metric] = (
+                mean,
+                std,
+                self._minq[metric][0][1],
+                self._maxq[metric][0][1],
+                col[first_slot],
+                col[last_slot],
+            )
+
+        return result
+
+    def to_numpy(self, metrics=None):
+        """
+        Return the live window as an (n, M) float64 ndarray, built
+        from zero-copy views of the rings (two slices when wrapped).
+        """
+        if metrics is None:
+            metrics = list(self.cols)
+
+        n = len(self)
+        mat = np.empty((n, len(metrics)), dtype=np.float64)
+        start = self._evicted % self.cap
+        split = min(n, self.cap - start)
+
+        for j, metric in enumerate(metrics):
+            view = np.frombuffer(self.cols[metric], dtype=np.float64)
+            mat[:split, j] = view[start:start + split]
+            if split < n:
+                mat[split:, j] = view[:n - split]
+
+        return mat
 
     def values(self):
-        return [item[1] for item in self.buffer]
+        return list(self.iter_values())
+
+    def iter_values(self):
+        """
+        Iterate window entries as dicts (reconstructed on demand;
+        the hot paths use stats()/to_numpy() and never touch this).
+        """
+        metrics = list(self.cols)
+        for i in range(self._evicted, self._added):
+            slot = i % self.cap
+            yield {m: self.cols[m][slot] for m in metrics}
 
     def is_ready(self):
-        return len(self.buffer) > 1
+        return len(self) > 1
@@ -1,7 +1,11 @@
 import os
-import csv
+import json
 from pathlib import Path
 
+import joblib
+import numpy as np
+import pandas as pd
+
 from models.stats_baseline import StatisticalBaseline
 from models.isolation_forest import IsolationForestModel
 
@@ -11,12 +15,39 @@ ISO_ENABLED = os.getenv("ISO_ENABLED", "1") == "1"
 BASE_DIR = Path(__file__).resolve().parent
 DATASET_FILE = BASE_DIR / "data" / "datasets" / "features.csv"
 
+MODEL_DIR = BASE_DIR / "data" / "models"
+ISO_MODEL_FILE = MODEL_DIR / "iso.joblib"
+STATS_MODEL_FILE = MODEL_DIR / "stats.joblib"
+FEATURE_KEYS_FILE = MODEL_DIR / "feature_keys.json"
+
+
+def load_pretrained_models():
+    """
+    Load models persisted by train_models.py (simulator mode only).
+    Returns (stats, iso_model, feature_keys) or None when no trained
+    artifacts exist, so startup skips the multi-second CSV refit.
+    """
+    try:
+        stats = joblib.load(STATS_MODEL_FILE)
+        iso_model = joblib.load(ISO_MODEL_FILE)
+
+        with open(FEATURE_KEYS_FILE) as f:
+            feature_keys = json.load(f)
+
+    except FileNotFoundError:
+        return None
+
+    return stats, iso_model, feature_keys
+
 
 def load_training_features():
     """
     Load simulator training features from CSV.
     Used ONLY in simulator mode.
     If dataset does not exist, return None safely.
+
+    Returns (X, feature_keys) with X as contiguous float32 — one
+    C-level parse instead of a per-cell DictReader float() loop.
     """
     if not DATASET_FILE.exists():
         print(
@@ -24,19 +55,14 @@ def load_training_features():
         )
         return None
 
-    X = []
-    with open(DATASET_FILE) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            row.pop("timestamp", None)
-            row.pop("label", None)
-            X.append({k: float(v) for k, v in row.items()})
+    df = pd.read_csv(DATASET_FILE)
+    df = df.drop(columns=["timestamp", "label"], errors="ignore")
 
-    if not X:
+    if df.empty:
         print("[LiveDetect] WARNING: Training dataset empty. Running without static training.")
         return None
 
-    return X
+    return df.to_numpy(np.float32), tuple(df.columns)
 
 
 class LiveAnomalyDetector:
@@ -48,10 +74,29 @@ class LiveAnomalyDetector:
         # SIMULATOR MODE (legacy, stable)
         # -------------------------------
         if self.profile == "simulator":
-            X = load_training_features()
+            # Prefer persisted models over retraining at every startup
+            pretrained = load_pretrained_models()
+            if pretrained is not None:
+                stats, iso_model, feature_keys = pretrained
+
+                self.stats = stats
+                self.feature_keys = feature_keys
+
+                if self.iso_enabled:
+                    self.iso = IsolationForestModel()
+                    self.iso.model = iso_model
+                    self.iso._fitted = True
+                else:
+                    self.iso = None
+
+                print(f"[LiveDetect] Loaded pretrained models from {MODEL_DIR}")
+                print(f"[LiveDetect] ISO_ENABLED={'1' if self.iso_enabled else '0'}")
+                return
+
+            loaded = load_training_features()
 
             # If dataset missing → fallback to dynamic mode
-            if X is None:
+            if loaded is None:
                 self.stats = None
                 self.iso = IsolationForestModel() if self.iso_enabled else None
                 self.feature_keys = None
@@ -59,15 +104,17 @@ class LiveAnomalyDetector:
                 print(f"[LiveDetect] ISO_ENABLED={'1' if self.iso_enabled else '0'}")
 
             else:
+                X, feature_keys = loaded
+
                 self.stats = StatisticalBaseline()
-                self.stats.fit(X)
+                self.stats.fit(X, keys=feature_keys)
 
                 # Keep feature order stable
-                self.feature_keys = list(X[0].keys())
+                self.feature_keys = list(feature_keys)
 
                 if self.iso_enabled:
                     self.iso = IsolationForestModel()
-                    self.iso.fit([[x[k] for k in self.feature_keys] for x in X])
+                    self.iso.fit(X)
                 else:
                     self.iso = None
 
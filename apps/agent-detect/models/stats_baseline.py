@@ -9,44 +9,60 @@ class StatisticalBaseline:
     - Tolerate missing features (schema evolution safe)
     - Never crash live detection
     - Simulator-only (ERP uses Isolation Forest)
+
+    Internals are vectorized: mean/std live in aligned ndarrays indexed
+    by feature order, so fit is one C-level reduction and score is a
+    single vectorized max instead of per-key Python loops.
     """
 
     def __init__(self, z_threshold=3.0):
         self.z_threshold = z_threshold
-        self.mean = {}
-        self.std = {}
+        self.keys = ()
+        self.mean = None
+        self.std = None
+        self.inv_std = None
 
-    def fit(self, X):
+    def fit(self, X, keys=None):
         """
-        X: list of feature dicts
+        X: list of feature dicts, or a 2-D ndarray with `keys` giving
+        the column order.
         """
-        if not X:
-            return
-
-        keys = X[0].keys()
+        if isinstance(X, np.ndarray):
+            if X.size == 0:
+                return
+            mat = np.asarray(X, dtype=np.float64)
+            self.keys = tuple(keys) if keys else tuple(range(mat.shape[1]))
+        else:
+            if not X:
+                return
+            self.keys = tuple(X[0].keys())
+            # Missing features stay NaN and are excluded via nan-reductions
+            mat = np.array(
+                [[row.get(k, np.nan) for k in self.keys] for row in X],
+                dtype=np.float64,
+            )
 
-        for k in keys:
-            values = [row[k] for row in X if k in row]
-            if not values:
-                continue
-            self.mean[k] = np.mean(values)
-            self.std[k] = np.std(values) + 1e-6
+        self.mean = np.nanmean(mat, axis=0)
+        self.std = np.nanstd(mat, axis=0) + 1e-6
+        self.inv_std = 1.0 / self.std
 
     def score(self, x):
         """
         Returns anomaly score (max z-score).
         Missing features are ignored safely.
         """
-        scores = []
+        if self.mean is None or not self.keys:
+            # If no comparable features, assume normal
+            return 0.0
 
-        for k, v in x.items():
-            if k not in self.mean or k not in self.std:
-                continue
-            z = abs(v - self.mean[k]) / self.std[k]
-            scores.append(z)
+        # Missing keys fall back to the mean, i.e. zero deviation
+        v = np.fromiter(
+            (x[k] if k in x else self.mean[i] for i, k in enumerate(self.keys)),
+            dtype=np.float64,
+            count=len(self.keys),
+        )
 
-        # If no comparable features, assume normal
-        return max(scores) if scores else 0.0
+        return float(np.max(np.abs(v - self.mean) * self.inv_std))
 
     def predict(self, x):
         return self.score(x) > self.z_threshold
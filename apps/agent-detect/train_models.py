@@ -1,35 +1,52 @@
-import csv
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
 from models.stats_baseline import StatisticalBaseline
 from models.isolation_forest import IsolationForestModel
 
 DATASET_FILE = "data/datasets/features.csv"
 
-def load_dataset():
-    X, y = [], []
-
-    with open(DATASET_FILE) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            label = int(row.pop("label"))
-            row.pop("timestamp")
+MODEL_DIR = "data/models"
+ISO_MODEL_FILE = os.path.join(MODEL_DIR, "iso.joblib")
+STATS_MODEL_FILE = os.path.join(MODEL_DIR, "stats.joblib")
+FEATURE_KEYS_FILE = os.path.join(MODEL_DIR, "feature_keys.json")
 
-            X.append({k: float(v) for k, v in row.items()})
-            y.append(label)
+def load_dataset():
+    """
+    One C-level CSV parse instead of a per-cell DictReader float() loop.
+    Returns (X, y, feature_keys) with X as contiguous float32.
+    """
+    df = pd.read_csv(DATASET_FILE)
+    y = df.pop("label").to_numpy(np.int8)
+    df.pop("timestamp")
 
-    return X, y
+    return df.to_numpy(np.float32), y, tuple(df.columns)
 
 def main():
-    X, y = load_dataset()
+    X, y, feature_keys = load_dataset()
 
     # Train baseline
     stats = StatisticalBaseline()
-    stats.fit(X)
+    stats.fit(X, keys=feature_keys)
 
     # Train Isolation Forest
     iso = IsolationForestModel()
-    iso.fit([list(x.values()) for x in X])
+    iso.fit(X)
+
+    # Persist models so live detection loads instead of retraining
+    os.makedirs(MODEL_DIR, exist_ok=True)
+    joblib.dump(stats, STATS_MODEL_FILE)
+    joblib.dump(iso.model, ISO_MODEL_FILE)
+
+    with open(FEATURE_KEYS_FILE, "w") as f:
+        json.dump(list(feature_keys), f)
 
     print("[OK] Models trained successfully")
+    print(f"[OK] Models saved to {MODEL_DIR}/")
 
 if __name__ == "__main__":
     main()
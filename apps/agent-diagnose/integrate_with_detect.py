@@ -1,6 +1,7 @@
 import time
 import os
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from typing import Optional, List, Dict, Any
 
 from rca_engine import RCAEngine
@@ -21,7 +22,40 @@ ORCH_URL = os.getenv("ORCH_URL", "http://smartops-orchestrator:8001").rstrip("/"
 
 TARGET_SERVICE = os.getenv("TARGET_SERVICE", "erp-simulator")
 RECENT_LIMIT = int(os.getenv("RECENT_LIMIT", "50"))
-POLL_SECONDS = int(os.getenv("DIAGNOSE_POLL_SECONDS", "10"))
+
+# Adaptive polling: back off while the system is healthy, react fast
+# right after an anomaly shows up
+POLL_MIN_SECONDS = float(os.getenv("RCA_POLL_MIN", "2"))
+POLL_MAX_SECONDS = float(os.getenv("RCA_POLL_MAX", "60"))
+POLL_BACKOFF_FACTOR = 1.5
+
+# Hoisted endpoint URLs (built once, not per poll)
+SIGNALS_RECENT_URL = f"{ORCH_URL}/v1/signals/recent"
+SIGNALS_RCA_URL = f"{ORCH_URL}/v1/signals/rca"
+
+# Persistent keep-alive session: the 10s poll loop reuses one pooled
+# connection instead of a fresh TCP handshake per request
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=1, backoff_factor=0.1),
+    ),
+)
+
+# Pipeline stages are stateless: build them once instead of
+# re-instantiating all four on every poll iteration
+_correlator = Correlator()
+_linker = SignalLinker()
+_decider = RCADecider()
+_reporter = RCAReporter()
+
+# Local report path (computed once; the path never changes at runtime)
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.abspath(os.path.join(_SCRIPT_DIR, "..", ".."))
+RCA_OUTPUT_PATH = os.path.join(_PROJECT_ROOT, "data", "runtime", "latest_rca.json")
 
 # Prevent duplicate RCA spam for the same anomaly window
 last_processed_window_id: Optional[str] = None
@@ -42,8 +76,8 @@ def get_recent_payload(limit: int = RECENT_LIMIT) -> Dict[str, Any]:
       }
     """
     try:
-        res = requests.get(
-            f"{ORCH_URL}/v1/signals/recent",
+        res = _SESSION.get(
+            SIGNALS_RECENT_URL,
             params={"limit": limit},
             timeout=3,
         )
@@ -124,8 +158,8 @@ def send_rca_signal(report: dict):
             "metadata": report.get("metadata", {}),
         }
 
-        response = requests.post(
-            f"{ORCH_URL}/v1/signals/rca",
+        response = _SESSION.post(
+            SIGNALS_RCA_URL,
             json=payload,
             timeout=3,
         )
@@ -143,13 +177,17 @@ def send_rca_signal(report: dict):
 # 🔹 MAIN RCA PIPELINE (Stage 3.4 → 3.6)
 # -------------------------------------------------
 def run_rca():
+    """
+    Returns True when an active anomaly was seen (used by the poll
+    loop to decide how aggressively to poll).
+    """
     global last_processed_window_id
 
     anomaly = get_latest_anomaly_for_service(TARGET_SERVICE)
 
     if not anomaly:
         print("[INFO] No recent anomaly for service — RCA skipped")
-        return
+        return False
 
     # Orchestrator AnomalySignal schema uses: windowId, isAnomaly, score, type
     window_id = anomaly.get("windowId")
@@ -159,11 +197,11 @@ def run_rca():
     if not window_id:
         # Rare, but protects against malformed signals
         print("[WARN] Anomaly missing windowId — RCA skipped")
-        return
+        return False
 
     # prevent duplicate RCA for same anomaly window
     if window_id == last_processed_window_id:
-        return
+        return True
 
     print(f"[INFO] Running RCA for anomaly: type={anomaly_type} windowId={window_id} score={score}")
 
@@ -174,22 +212,17 @@ def run_rca():
     trace_events = [{"from": "OrderService", "to": "DatabaseService", "latency": 850}]
 
     # ---------------- Stage 3.4 ----------------
-    correlator = Correlator()
-    correlated = correlator.correlate(metric_events, log_events, trace_events)
+    correlated = _correlator.correlate(metric_events, log_events, trace_events)
 
-    linker = SignalLinker()
-    failure_type = linker.infer_failure_type(correlated)
+    failure_type = _linker.infer_failure_type(correlated)
 
     # ---------------- Stage 3.5 ----------------
-    decider = RCADecider()
-    root_cause, confidence = decider.decide(correlated, failure_type)
+    root_cause, confidence = _decider.decide(correlated, failure_type)
 
     # ---------------- Stage 3.6 ----------------
-    reporter = RCAReporter()
-
     # IMPORTANT:
     # Use the SAME windowId as the anomaly so orchestrator can correlate.
-    report = reporter.generate(
+    report = _reporter.generate(
         anomaly_id=window_id,
         anomaly_type=str(anomaly_type),
         root_cause=root_cause,
@@ -197,22 +230,19 @@ def run_rca():
         confidence=confidence
     )
 
-    reporter.print_report(report)
+    _reporter.print_report(report)
 
     # ---------------- Save JSON locally ----------------
     # NOTE: In containers, this path may not be persisted; kept for parity.
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.abspath(os.path.join(script_dir, "..", ".."))
-    output_path = os.path.join(project_root, "data", "runtime", "latest_rca.json")
-
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    print(f"[INFO] Saving report to: {output_path}")
-    reporter.save_json(report, output_path)
+    os.makedirs(os.path.dirname(RCA_OUTPUT_PATH), exist_ok=True)
+    print(f"[INFO] Saving report to: {RCA_OUTPUT_PATH}")
+    _reporter.save_json(report, RCA_OUTPUT_PATH)
 
     # ---------------- Send to Orchestrator ----------------
     send_rca_signal(report)
 
     last_processed_window_id = window_id
+    return True
 
 
 # -------------------------------------------------
@@ -223,8 +253,14 @@ if __name__ == "__main__":
     print(f"[INFO] ERP_URL={ERP_URL} (unused in HTTP-bus mode)")
     print(f"[INFO] ORCH_URL={ORCH_URL}")
     print(f"[INFO] TARGET_SERVICE={TARGET_SERVICE}")
-    print(f"[INFO] POLL_SECONDS={POLL_SECONDS}")
+    print(f"[INFO] POLL_SECONDS={POLL_MIN_SECONDS}-{POLL_MAX_SECONDS} (adaptive)")
+
+    interval = POLL_MIN_SECONDS
 
     while True:
-        run_rca()
-        time.sleep(POLL_SECONDS)
+        if run_rca():
+            interval = POLL_MIN_SECONDS
+        else:
+            interval = min(interval * POLL_BACKOFF_FACTOR, POLL_MAX_SECONDS)
+
+        time.sleep(interval)
@@ -1,12 +1,22 @@
-import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Ring cap so long runs can't grow the buffer without bound
+MAX_BUFFERED_LOGS = 100_000
+
 
 class LogCollector:
     """
     Collects logs during anomaly windows.
+
+    Entries arrive in timestamp order, so a parallel array of
+    timestamps allows O(log n) bisect window slicing instead of a
+    full linear scan per fetch.
     """
 
     def __init__(self):
         self.buffer = []
+        self._ts = array("d")
 
     def ingest(self, timestamp, level, message):
         self.buffer.append({
@@ -14,9 +24,14 @@ class LogCollector:
             "level": level,
             "message": message
         })
+        self._ts.append(timestamp)
+
+        if len(self.buffer) > MAX_BUFFERED_LOGS:
+            overflow = len(self.buffer) - MAX_BUFFERED_LOGS
+            del self.buffer[:overflow]
+            del self._ts[:overflow]
 
     def fetch_between(self, start_ts, end_ts):
-        return [
-            log for log in self.buffer
-            if start_ts <= log["timestamp"] <= end_ts
-        ]
+        lo = bisect_left(self._ts, start_ts)
+        hi = bisect_right(self._ts, end_ts)
+        return self.buffer[lo:hi]
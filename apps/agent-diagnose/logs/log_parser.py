@@ -1,29 +1,49 @@
-import re
+from functools import lru_cache
+
+from logs.patterns import COMPILED_PATTERNS, bloom_might_match
 
 class LogParser:
     """
     Normalizes raw log messages into structured events.
     """
 
-    ERROR_PATTERNS = [
-        "error", "exception", "timeout", "failed"
-    ]
+    # Precompiled alternations: one C-level scan per severity class
+    # instead of several Python substring checks over a lowered copy.
+    # Patterns live in logs/patterns.py, which lints them against
+    # quadratic-backtracking constructs at import time.
+    _ERR_RE = COMPILED_PATTERNS["ERROR"]
+    _WARN_RE = COMPILED_PATTERNS["WARNING"]
 
-    WARNING_PATTERNS = [
-        "warning", "slow", "retry"
-    ]
+    # Cheap substring prefilter: most lines are plain INFO, and
+    # str.__contains__ is far cheaper than firing up the regex engine.
+    # Keywords are stems of the alternations above, so the regex only
+    # runs on lines that could possibly match.
+    _HOT_ERR = ("err", "exc", "time", "fail")
+    _HOT_WARN = ("warn", "slow", "retry")
 
-    def parse(self, log):
-        msg = log["message"].lower()
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify(msg):
+        # Identical messages arrive in bursts; cache hits skip the
+        # scans entirely
+        low = msg.lower()
+        # Bloom over pattern 3-grams: a miss proves no severity
+        # pattern can match, so the INFO-only majority returns here
+        if not bloom_might_match(low):
+            return "INFO"
+        if any(k in low for k in LogParser._HOT_ERR):
+            if LogParser._ERR_RE.search(msg):
+                return "ERROR"
+        if any(k in low for k in LogParser._HOT_WARN):
+            if LogParser._WARN_RE.search(msg):
+                return "WARNING"
+        return "INFO"
 
-        severity = "INFO"
-        if any(p in msg for p in self.ERROR_PATTERNS):
-            severity = "ERROR"
-        elif any(p in msg for p in self.WARNING_PATTERNS):
-            severity = "WARNING"
+    def parse(self, log):
+        msg = log["message"]
 
         return {
             "timestamp": log["timestamp"],
-            "severity": severity,
-            "message": log["message"]
+            "severity": self._classify(msg),
+            "message": msg
         }
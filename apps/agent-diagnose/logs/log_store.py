@@ -1,23 +1,61 @@
+import numpy as np
+
+# Severity ranks (uint8 codes in the SoA severity column)
+SEVERITY_RANK = {"INFO": 0, "WARNING": 1, "ERROR": 2}
+_SEVERITY_NAME = ("INFO", "WARNING", "ERROR")
+
+
 class LogStore:
     """
     Stores structured logs for RCA correlation.
+
+    Columnar layout (SoA): timestamps and severity codes live in
+    parallel NumPy arrays (geometrically grown), messages in a plain
+    list. Queries are a searchsorted window plus one vectorized
+    severity compare; dicts are materialized only for returned rows.
     """
 
+    _INITIAL_CAPACITY = 1024
+
     def __init__(self):
-        self.events = []
+        self._ts = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._sev = np.empty(self._INITIAL_CAPACITY, dtype=np.uint8)
+        self._msg = []
+        self._n = 0
+
+    def __len__(self):
+        return self._n
 
     def add(self, event):
-        self.events.append(event)
+        if self._n == len(self._ts):
+            self._ts = np.resize(self._ts, self._n * 2)
+            self._sev = np.resize(self._sev, self._n * 2)
+
+        self._ts[self._n] = event["timestamp"]
+        self._sev[self._n] = SEVERITY_RANK.get(event["severity"], 0)
+        self._msg.append(event["message"])
+        self._n += 1
+
+    def query(self, start_ts, end_ts, min_severity="INFO"):
+        lo, hi = np.searchsorted(self._ts[:self._n], [start_ts, end_ts], side="left")
+        # include events at exactly end_ts (inclusive range, as before)
+        while hi < self._n and self._ts[hi] == end_ts:
+            hi += 1
 
-    def query(self, start_ts, end_ts, min_severity=None):
-        results = []
+        if lo == hi:
+            return []
 
-        for e in self.events:
-            if start_ts <= e["timestamp"] <= end_ts:
-                if min_severity:
-                    if e["severity"] in ["ERROR", "WARNING"]:
-                        results.append(e)
-                else:
-                    results.append(e)
+        rank = SEVERITY_RANK[min_severity]
+        if rank > 0:
+            indices = np.flatnonzero(self._sev[lo:hi] >= rank) + lo
+        else:
+            indices = range(lo, hi)
 
-        return results
+        return [
+            {
+                "timestamp": float(self._ts[i]),
+                "severity": _SEVERITY_NAME[self._sev[i]],
+                "message": self._msg[i],
+            }
+            for i in indices
+        ]
@@ -0,0 +1,85 @@
+import re
+
+try:
+    # google-re2 runs in guaranteed linear time; stdlib re backtracks.
+    # Optional — the patterns below are safe under either engine.
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# ------------------------------------------------------------------
+# Severity patterns for log classification.
+#
+# Project rule: patterns added here must not contain unbounded
+# negated-class captures like ([^:]+) — Python's backtracking engine
+# turns those into O(n^2) scans on long log lines. Prefer plain
+# literal alternations, non-greedy .*?, or anchors. Every pattern is
+# linted and compiled at import time, so a bad pattern fails fast
+# instead of regressing the hot path at runtime.
+# ------------------------------------------------------------------
+
+SAFE_PATTERNS = {
+    "ERROR": r"error|exception|timeout|failed",
+    "WARNING": r"warning|slow|retry",
+}
+
+# Unbounded negated-class capture, e.g. ([^:]+) — quadratic risk
+_QUADRATIC_CONSTRUCT = re.compile(r"\(\[\^[^\]]+\]\+\)")
+
+
+def _lint(pattern):
+    if _QUADRATIC_CONSTRUCT.search(pattern):
+        raise ValueError(
+            f"pattern {pattern!r} contains an unbounded negated-class "
+            "capture — quadratic backtracking risk; rewrite with an "
+            "anchor or non-greedy match"
+        )
+    return pattern
+
+
+COMPILED_PATTERNS = {
+    severity: _re.compile(_lint(pattern), _re.IGNORECASE)
+    for severity, pattern in SAFE_PATTERNS.items()
+}
+
+# ------------------------------------------------------------------
+# 3-gram Bloom prefilter.
+#
+# A message can only match one of the literal alternations above if it
+# contains at least one 3-gram of one of the alternatives. We pack
+# those 3-grams into a 4096-bit Bloom filter (two hash probes) so the
+# ingest path can reject the INFO-only majority of traffic with a
+# sliding substring scan instead of invoking the regex engine.
+# ------------------------------------------------------------------
+
+_BLOOM_BITS = 4096
+_BLOOM_MASK = _BLOOM_BITS - 1
+
+_PATTERN_NGRAMS = {
+    word[i:i + 3]
+    for pattern in SAFE_PATTERNS.values()
+    for word in pattern.split("|")
+    for i in range(len(word) - 2)
+}
+
+_BLOOM = 0
+for _gram in _PATTERN_NGRAMS:
+    _h = hash(_gram)
+    _BLOOM |= 1 << (_h & _BLOOM_MASK)
+    _BLOOM |= 1 << ((_h >> 17) & _BLOOM_MASK)
+del _gram, _h
+
+
+def bloom_might_match(low):
+    """
+    True if any 3-gram of `low` (already lowercased) hits the Bloom
+    filter — i.e. the message could match a severity pattern. False
+    means a guaranteed non-match; callers can skip the regexes.
+    """
+    bloom = _BLOOM
+    mask = _BLOOM_MASK
+    for i in range(len(low) - 2):
+        h = hash(low[i:i + 3])
+        if (bloom >> (h & mask)) & 1 and (bloom >> ((h >> 17) & mask)) & 1:
+            return True
+    return False
@@ -1,6 +1,9 @@
 from datetime import datetime
 from contracts import RCAReport, RCAEvidence, RCARootCause
 
+# Bound once: skips the module + attribute lookups per report
+_utcnow = datetime.utcnow
+
 class RCAEngine:
     def __init__(self):
         pass
@@ -21,9 +24,12 @@ class RCAEngine:
             traces=trace_context
         )
 
+        # One clock read per report, reused for both fields
+        now = _utcnow()
+
         report = RCAReport(
-            anomaly_id=f"A-{datetime.utcnow().timestamp()}",
-            timestamp=datetime.utcnow().isoformat(),
+            anomaly_id=f"A-{now.timestamp()}",
+            timestamp=now.isoformat(),
             detected_anomaly=anomaly_type,
             root_cause=root_cause,
             evidence=evidence,
@@ -1,6 +1,19 @@
 import json
+import os
+import tempfile
 from datetime import datetime
 
+# Bound once: skips the module + attribute lookups per report
+_utcnow = datetime.utcnow
+
+try:
+    import orjson
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional; stdlib json still works
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
 class RCAReporter:
     """
     Formats and outputs RCA reports.
@@ -9,7 +22,7 @@ class RCAReporter:
     def generate(self, anomaly_id, anomaly_type, root_cause, evidence, confidence):
         report = {
             "anomaly_id": anomaly_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utcnow().isoformat(),
             "detected_anomaly": anomaly_type,
             "root_cause": root_cause,
             "evidence": evidence,
@@ -40,5 +53,17 @@ class RCAReporter:
         print("=====================================\n")
 
     def save_json(self, report, filepath):
-        with open(filepath, "w") as f:
-            json.dump(report, f, indent=2)
+        # Write to a temp file in the same directory, then rename: the
+        # dashboard polls this path and must never see a half-written file
+        dirname = os.path.dirname(os.path.abspath(filepath))
+        fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(report))
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
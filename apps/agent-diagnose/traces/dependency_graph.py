@@ -1,31 +1,43 @@
-from collections import defaultdict
+from array import array
+
+import numpy as np
+
 
 class DependencyGraph:
     """
     Builds service dependency graphs from traces.
+
+    Edges are kept columnar (parent list, child list, int32 latency
+    array) so the hot-path scan is one vectorized threshold compare
+    instead of a nested Python loop over dicts.
     """
 
     def __init__(self):
-        self.graph = defaultdict(list)
+        self._parents = []
+        self._services = []
+        self._lat = array("i")
 
     def add_span(self, service, parent_service, duration_ms):
         if parent_service:
-            self.graph[parent_service].append({
-                "service": service,
-                "latency": duration_ms
-            })
+            self._parents.append(parent_service)
+            self._services.append(service)
+            self._lat.append(int(duration_ms))
 
     def get_hot_paths(self, latency_threshold=200):
         """
         Returns service paths with high latency.
         """
-        hot = []
-        for parent, children in self.graph.items():
-            for c in children:
-                if c["latency"] >= latency_threshold:
-                    hot.append({
-                        "from": parent,
-                        "to": c["service"],
-                        "latency": c["latency"]
-                    })
-        return hot
+        if not self._lat:
+            return []
+
+        latencies = np.frombuffer(self._lat, dtype=np.int32)
+        hits = np.flatnonzero(latencies >= latency_threshold)
+
+        return [
+            {
+                "from": self._parents[i],
+                "to": self._services[i],
+                "latency": int(latencies[i]),
+            }
+            for i in hits
+        ]
@@ -1,13 +1,24 @@
+from collections import defaultdict
+from itertools import chain
+
+
 class TraceCollector:
     """
     Collects trace spans during anomaly windows.
+
+    Spans are indexed by trace_id at ingest time so per-trace lookup
+    is O(spans in trace) instead of a scan over every span collected.
     """
 
     def __init__(self):
-        self.spans = []
+        self.by_trace = defaultdict(list)
+
+    @property
+    def spans(self):
+        return list(chain.from_iterable(self.by_trace.values()))
 
     def ingest(self, trace_id, span_id, service, parent_span, duration_ms):
-        self.spans.append({
+        self.by_trace[trace_id].append({
             "trace_id": trace_id,
             "span_id": span_id,
             "service": service,
@@ -16,4 +27,4 @@ class TraceCollector:
         })
 
     def fetch_by_trace(self, trace_id):
-        return [s for s in self.spans if s["trace_id"] == trace_id]
+        return self.by_trace.get(trace_id, [])
@@ -1,5 +1,6 @@
 import os
 import logging
+from dataclasses import asdict
 import requests
 from flask import Flask, render_template, jsonify, request
 from services.artifact_reader import ArtifactReader
@@ -31,6 +32,14 @@ POLICY_ENGINE_URL = os.getenv(
     "http://127.0.0.1:5051"
 ).rstrip("/")
 
+# Shared pooled session for downstream calls so concurrent dashboard
+# users reuse keep-alive connections instead of handshaking per hit
+_pe_session = requests.Session()
+_pe_session.mount(
+    "http://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32),
+)
+
 
 @app.context_processor
 def inject_globals():
@@ -93,9 +102,9 @@ def api_overview():
         "status": "ok",
         "mode": MODE,
         "system_status": "Healthy" if not anomaly else "Degraded",
-        "latest_anomaly": anomaly.__dict__ if anomaly else None,
-        "latest_rca": rca.__dict__ if rca else None,
-        "recent_decisions": [d.__dict__ for d in decisions],
+        "latest_anomaly": asdict(anomaly) if anomaly else None,
+        "latest_rca": asdict(rca) if rca else None,
+        "recent_decisions": [asdict(d) for d in decisions],
         "erp_odoo": erp_odoo,
     })
 
@@ -146,8 +155,8 @@ def api_anomalies():
     features = reader.get_latest_features()
     return jsonify({
         "status": "ok",
-        "latest_event": anomaly.__dict__ if anomaly else None,
-        "feature_breakdown": features.__dict__ if features else None
+        "latest_event": asdict(anomaly) if anomaly else None,
+        "feature_breakdown": asdict(features) if features else None
     })
 
 
@@ -156,14 +165,14 @@ def api_rca():
     report = reader.get_latest_rca()
     return jsonify({
         "status": "ok",
-        "report": report.__dict__ if report else None
+        "report": asdict(report) if report else None
     })
 
 
 @app.route('/api/policies')
 def api_policies():
     try:
-        resp = requests.get(
+        resp = _pe_session.get(
             f"{POLICY_ENGINE_URL}/v1/policy/audit/latest?n=50",
             timeout=3,
         )
@@ -201,8 +210,12 @@ def api_policies():
 def api_service_metrics():
     namespace = "smartops-dev"
 
-    erp_health = prom.get_deployment_health(namespace, "smartops-erp-simulator")
-    orch_health = prom.get_deployment_health(namespace, "smartops-orchestrator")
+    # Single concurrent fan-out for both health cards
+    health = prom.get_deployments_health(
+        namespace, ["smartops-erp-simulator", "smartops-orchestrator"]
+    )
+    erp_health = health["smartops-erp-simulator"]
+    orch_health = health["smartops-orchestrator"]
 
     erp_latency_ms = prom.get_latency_p95_ms_progressive({
         "namespace": namespace
@@ -220,7 +233,7 @@ def api_service_metrics():
 @app.route("/api/policy/decisions")
 def policy_decisions():
     try:
-        resp = requests.get(
+        resp = _pe_session.get(
             f"{POLICY_ENGINE_URL}/v1/policy/audit/latest?n=10",
             timeout=3,
         )
@@ -233,6 +246,10 @@ def policy_decisions():
             "events": [],
         }, 200
 
-port = int(os.environ.get("DASHBOARD_PORT", 5050))
-debug = os.environ.get("DASHBOARD_DEBUG", "false").strip().lower() in ("1", "true", "yes", "y", "on")
-app.run(host="0.0.0.0", port=port, debug=debug, use_reloader=debug)
+# Local/dev entry point only. In containers the app is served by
+# gunicorn (gevent workers) — see the Dockerfile CMD — so a blocking
+# downstream call no longer head-of-line-blocks other dashboard users.
+if __name__ == "__main__":
+    port = int(os.environ.get("DASHBOARD_PORT", 5050))
+    debug = os.environ.get("DASHBOARD_DEBUG", "false").strip().lower() in ("1", "true", "yes", "y", "on")
+    app.run(host="0.0.0.0", port=port, debug=debug, use_reloader=debug, threaded=True)
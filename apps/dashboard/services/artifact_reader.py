@@ -1,6 +1,17 @@
+import asyncio
 import json
+import mmap
 import os
 import logging
+import threading
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _HAS_ORJSON = True
+except ImportError:  # orjson is optional; stdlib json still works
+    _loads = json.loads
+    _HAS_ORJSON = False
 from typing import List, Optional
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,6 +25,40 @@ from services.dto import (
 
 logger = logging.getLogger("dashboard.reader")
 
+_TAIL_CHUNK = 64 * 1024
+
+
+def _tail_lines(path: Path, n: int) -> List[bytes]:
+    """
+    Return the last n lines of a file (as bytes) by reading backwards
+    in 64 KiB chunks from the end, so memory stays O(n) even when the
+    audit log grows to hundreds of MB. Lines stay bytes so orjson can
+    parse them without an intermediate utf-8 decode pass.
+    """
+    chunks = []
+    newlines = 0
+
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+
+        while pos > 0 and newlines <= n:
+            step = min(_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+
+    # Chunks were collected back-to-front; one reversed join instead of
+    # repeated O(total) bytes prepends
+    return b"".join(reversed(chunks)).splitlines()[-n:]
+
+
+# Per-day epoch cache for the fast manual parser: audit lines cluster
+# on a handful of dates, so the datetime machinery runs once per day
+_DAY_EPOCH_CACHE: dict = {}
+
 
 def _iso_to_epoch(ts_raw: Optional[str]) -> float:
     """
@@ -22,6 +67,27 @@ def _iso_to_epoch(ts_raw: Optional[str]) -> float:
     """
     if not ts_raw:
         return 0.0
+
+    # Fast path for the fixed YYYY-MM-DDTHH:MM:SS(.fff)?Z shape the
+    # policy engine emits: int slicing + a cached per-day epoch beats
+    # a full datetime construction per audit line
+    try:
+        if len(ts_raw) >= 20 and ts_raw[10] == "T" and ts_raw[-1] == "Z":
+            day = ts_raw[:10]
+            day_epoch = _DAY_EPOCH_CACHE.get(day)
+            if day_epoch is None:
+                dt = datetime.fromisoformat(day).replace(tzinfo=timezone.utc)
+                day_epoch = _DAY_EPOCH_CACHE[day] = dt.timestamp()
+            secs = (
+                int(ts_raw[11:13]) * 3600
+                + int(ts_raw[14:16]) * 60
+                + int(ts_raw[17:19])
+            )
+            frac = float(ts_raw[19:-1]) if ts_raw[19] == "." else 0.0
+            return day_epoch + secs + frac
+    except Exception:
+        pass  # odd shape — fall through to the general parser
+
     try:
         # Support trailing 'Z'
         ts = ts_raw.replace("Z", "+00:00")
@@ -33,76 +99,117 @@ def _iso_to_epoch(ts_raw: Optional[str]) -> float:
         return 0.0
 
 
-class ArtifactReader:
+# Resolved once at import: readers may be constructed per request (DI
+# style), and path resolution + env lookups should not recur each time.
+# services/ -> dashboard/ -> apps/ -> <repo_root>
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _resolve_paths() -> dict:
     """
-    Reads runtime artifacts for the SmartOps dashboard.
+    Decide artifact paths.
 
     Priority:
     1) ARTIFACT_DIR env var (if set)
     2) In-cluster mounted path: /data/runtime
     3) Repo-root fallback: <project_root>/data/runtime
     """
+    in_cluster = bool(os.environ.get("KUBERNETES_SERVICE_HOST"))
+    env_artifact_dir = os.getenv("ARTIFACT_DIR")
+
+    if env_artifact_dir:
+        runtime_dir = Path(env_artifact_dir).expanduser()
+    elif in_cluster:
+        runtime_dir = Path("/data/runtime")
+    else:
+        runtime_dir = _PROJECT_ROOT / "data" / "runtime"
+
+    # Policy audit log path (optional file-based)
+    # In your current deployment you rely on Policy Engine API more than file, so this can stay optional.
+    audit_log_env = os.getenv("AUDIT_LOG_PATH")
+    if audit_log_env:
+        audit_log_path = Path(audit_log_env).expanduser()
+    else:
+        audit_log_path = _PROJECT_ROOT / "policy_engine" / "audit" / "policy_decisions.jsonl"
+
+    return {
+        "runtime_dir": runtime_dir,
+        "detection": runtime_dir / "latest_detection.json",
+        "features": runtime_dir / "latest_features.json",
+        "rca": runtime_dir / "latest_rca.json",
+        "audit_log": audit_log_path,
+    }
+
+
+_PATHS = _resolve_paths()
+_RUNTIME_DIR = _PATHS.pop("runtime_dir")
+
+
+class ArtifactReader:
+    """
+    Reads runtime artifacts for the SmartOps dashboard.
+
+    Paths are resolved once at import time (see _resolve_paths); an
+    instance is just a view over them plus the shared parse caches.
+    """
 
     def __init__(self):
-        # Resolve "project_root" (repo root) for local fallback only
-        current_file = Path(__file__).resolve()
-        services_dir = current_file.parent
-        dashboard_dir = services_dir.parent
-        apps_dir = dashboard_dir.parent
-        project_root = apps_dir.parent  # <repo_root> when running locally
-        self.project_root = str(project_root)
-
-        # Decide runtime directory
-        in_cluster = bool(os.environ.get("KUBERNETES_SERVICE_HOST"))
-        env_artifact_dir = os.getenv("ARTIFACT_DIR")
-
-        if env_artifact_dir:
-            runtime_dir = Path(env_artifact_dir).expanduser()
-        elif in_cluster:
-            runtime_dir = Path("/data/runtime")
-        else:
-            runtime_dir = project_root / "data" / "runtime"
-
-        self.runtime_dir = runtime_dir
-
-        # Policy audit log path (optional file-based)
-        # In your current deployment you rely on Policy Engine API more than file, so this can stay optional.
-        audit_log_env = os.getenv("AUDIT_LOG_PATH")
-        if audit_log_env:
-            audit_log_path = Path(audit_log_env).expanduser()
-        else:
-            audit_log_path = project_root / "policy_engine" / "audit" / "policy_decisions.jsonl"
-
-        self.paths = {
-            "detection": runtime_dir / "latest_detection.json",
-            "features": runtime_dir / "latest_features.json",
-            "rca": runtime_dir / "latest_rca.json",
-            "audit_log": audit_log_path,
-        }
-
-        print("--- ARTIFACT READER DEBUG ---")
-        for k, v in self.paths.items():
-            try:
-                p = Path(v)
-                print(f"{k}: {str(p)} (exists={p.exists()})")
-            except Exception as e:
-                print(f"{k}: {v} (exists=ERROR: {e})")
-        print("-----------------------------")
+        self.project_root = str(_PROJECT_ROOT)
+        self.runtime_dir = _RUNTIME_DIR
+        self.paths = _PATHS
+
+        # Path diagnostics are debug-level only: the old startup prints
+        # stat()ed every artifact on import and spammed container logs
+        if logger.isEnabledFor(logging.DEBUG):
+            for k, v in self.paths.items():
+                logger.debug("artifact path %s: %s (exists=%s)", k, v, Path(v).exists())
 
     # ----------------------------------------------------
     # Internal helpers
     # ----------------------------------------------------
 
+    # mtime-keyed parse cache: dashboards poll faster than the writers
+    # update these files, so unchanged files cost one stat, zero parses
+    _cache = {}
+    _cache_lock = threading.Lock()
+
     def _read_json(self, path: Path) -> Optional[dict]:
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except OSError:
             return None
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = str(path)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
         try:
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            # mmap + memoryview hands the parser the page cache
+            # directly, skipping the read() copy into a bytes object
+            with path.open("rb") as f:
+                if st.st_size and _HAS_ORJSON:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        view = memoryview(mm)
+                        try:
+                            data = _loads(view)
+                        finally:
+                            view.release()
+                    finally:
+                        mm.close()
+                else:
+                    data = _loads(f.read())
         except Exception as e:
             logger.error("Failed to read %s: %s", str(path), e)
             return None
 
+        with self._cache_lock:
+            self._cache[key] = (stamp, data)
+        return data
+
     # ----------------------------------------------------
     # Detection / Anomaly
     # ----------------------------------------------------
@@ -201,15 +308,29 @@ class ArtifactReader:
     # Policy decisions (file-based optional)
     # ----------------------------------------------------
 
+    # Parsed-decision cache keyed on (inode, size, mtime_ns, limit):
+    # dashboards poll on a timer, so between appends the same tail
+    # parse would otherwise be redone every few seconds
+    _decisions_cache = {}
+    _DECISIONS_CACHE_MAX = 4
+
     def get_recent_decisions(self, limit: int = 50) -> List[PolicyDecision]:
         path = Path(self.paths["audit_log"])
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except OSError:
             return []
 
+        cache_key = (st.st_ino, st.st_size, st.st_mtime_ns, limit)
+        with self._cache_lock:
+            cached = self._decisions_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         decisions: List[PolicyDecision] = []
 
         try:
-            lines = path.read_text(encoding="utf-8").splitlines()[-limit:]
+            lines = _tail_lines(path, limit)
         except Exception as e:
             logger.debug("Failed reading audit log %s: %s", str(path), e)
             return []
@@ -218,7 +339,7 @@ class ArtifactReader:
             if not line.strip():
                 continue
             try:
-                entry = json.loads(line)
+                entry = _loads(line)
 
                 ts = _iso_to_epoch(entry.get("ts_utc")) or float(entry.get("ts", 0.0))
 
@@ -258,4 +379,28 @@ class ArtifactReader:
                 logger.debug("Skipping audit entry: %s", e)
                 continue
 
-        return sorted(decisions, key=lambda d: d.ts, reverse=True)
\ No newline at end of file
+        # The audit log is append-ordered by time, so the tail is
+        # already ascending: a reverse is O(N). Only fall back to a
+        # real sort if an inversion shows the file wasn't ordered.
+        decisions.reverse()
+        if any(
+            decisions[i].ts < decisions[i + 1].ts
+            for i in range(len(decisions) - 1)
+        ):
+            decisions.sort(key=lambda d: d.ts, reverse=True)
+
+        with self._cache_lock:
+            while len(self._decisions_cache) >= self._DECISIONS_CACHE_MAX:
+                self._decisions_cache.pop(next(iter(self._decisions_cache)))
+            self._decisions_cache[cache_key] = decisions
+
+        return decisions
+
+    async def get_recent_decisions_async(self, limit: int = 50) -> List[PolicyDecision]:
+        """
+        Async variant for event-loop callers: the blocking seek/read of
+        the audit tail runs in a worker thread so a slow disk or NFS
+        mount never stalls the loop. Same caching and results as the
+        sync method.
+        """
+        return await asyncio.to_thread(self.get_recent_decisions, limit)
\ No newline at end of file
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServiceHealth:
     """Standardized health status for services (ERP, Orchestrator, etc.)"""
     name: str
@@ -14,7 +14,7 @@ class ServiceHealth:
     p95_latency_ms: float = 0.0
     rps: float = 0.0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnomalyEvent:
     """Represents a detection event from the Agent-Detect module"""
     ts: float
@@ -24,7 +24,7 @@ class AnomalyEvent:
     model: str
     features_ref: Optional[str] = None  # Reference to feature snapshot ID
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeatureSnapshot:
     """Feature importance data for the anomaly explanation"""
     ts: float
@@ -32,7 +32,7 @@ class FeatureSnapshot:
     top_features: List[Dict[str, Any]] = field(default_factory=list)
     # Expected dict format: {'name': str, 'delta': float, 'value': float}
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RcaReport:
     """Root Cause Analysis output from Agent-Diagnose"""
     ts: float
@@ -41,7 +41,7 @@ class RcaReport:
     # Expected dict: {'component': str, 'cause': str, 'confidence': float}
     evidence: Dict[str, List[str]] = field(default_factory=lambda: {"trace_ids": [], "logs": []})
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PolicyDecision:
     """Audit record of a policy evaluation"""
     ts: float
@@ -52,7 +52,7 @@ class PolicyDecision:
     # Expected dict: {'name': str, 'triggered': bool}
     recommended_actions: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionExecution:
     """History of a manual or automated action"""
     ts: float
@@ -64,7 +64,7 @@ class ActionExecution:
     duration_ms: float
     trace_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerificationResult:
     """Results of post-action verification checks"""
     ts: float
@@ -1,10 +1,55 @@
 import os
+import time
+import threading
 import requests
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for fanning out independent instant queries: each health
+# card needs several PromQL calls, and paying RTT sequentially dominates
+# when Prometheus is a network hop away
+_QUERY_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="promql")
+
+# Query templates preformatted once; hot methods only .format() in the
+# selector fragment instead of rebuilding whole PromQL strings
+_HEALTH_QUERY_TEMPLATES = (
+    "max(kube_deployment_spec_replicas{{{sel}}})",
+    "max(kube_deployment_status_replicas_ready{{{sel}}})",
+    "max(kube_deployment_status_replicas_available{{{sel}}})",
+)
+
+_LATENCY_BUCKET_CANDIDATES = (
+    # common HTTP-style
+    "http_request_duration_seconds_bucket",
+    "http_server_duration_seconds_bucket",
+    "http_duration_seconds_bucket",
+    # common custom
+    "request_duration_seconds_bucket",
+    "requests_duration_seconds_bucket",
+    # generic
+    "duration_seconds_bucket",
+)
+
+_LATENCY_QUERY_TEMPLATES = tuple(
+    f"histogram_quantile(0.95, sum(rate({metric}{{sel}}[5m])) by (le))"
+    for metric in _LATENCY_BUCKET_CANDIDATES
+)
+
+
+@lru_cache(maxsize=256)
+def _deployment_queries(namespace: str, deployment: str) -> Tuple[str, str, str]:
+    """
+    Fully-formatted health query triple for one deployment. The
+    dashboard polls the same few deployments forever, so each triple is
+    built exactly once.
+    """
+    sel = f'namespace="{namespace}",deployment="{deployment}"'
+    return tuple(tpl.format(sel=sel) for tpl in _HEALTH_QUERY_TEMPLATES)
+
 
 def _env_bool(name: str, default: Optional[bool] = None) -> Optional[bool]:
     """
@@ -60,6 +105,29 @@ class PrometheusClient:
         self.base_url = prom_url or (default_k8s_url if in_cluster else default_local_url)
         self.base_url = self.base_url.rstrip("/")
 
+        # Pooled keep-alive session: the query fan-out hits Prometheus
+        # many times per refresh and must not handshake per query
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=0
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Accept-Encoding"] = "gzip"
+
+        # Short-TTL result cache: dashboards re-issue the same handful
+        # of PromQL strings every refresh, and concurrent viewers would
+        # otherwise multiply identical queries against Prometheus
+        self._q_cache: Dict[str, tuple] = {}
+        self._q_cache_lock = threading.Lock()
+        self._q_cache_ttl = float(os.environ.get("PROMETHEUS_CACHE_TTL", "3"))
+
+        # Progressive latency probing: remember which candidate bucket
+        # metric answered last time so steady state costs one query,
+        # not up to six misses
+        self._known_latency_tpl: Optional[str] = None
+        self._known_latency_misses = 0
+
         logger.info("PrometheusClient base_url=%s enabled=%s", self.base_url, self.enabled)
 
     # -------------------------------
@@ -74,8 +142,14 @@ class PrometheusClient:
         if not self.enabled:
             return None
 
+        now = time.monotonic()
+        with self._q_cache_lock:
+            cached = self._q_cache.get(query)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
         try:
-            r = requests.get(
+            r = self._session.get(
                 f"{self.base_url}/api/v1/query",
                 params={"query": query},
                 timeout=3,
@@ -91,12 +165,27 @@ class PrometheusClient:
                 return None
 
             # Prometheus returns [ <timestamp>, "<value>" ]
-            return float(result[0]["value"][1])
+            value = float(result[0]["value"][1])
+
+            with self._q_cache_lock:
+                if len(self._q_cache) > 256:
+                    self._q_cache.clear()
+                self._q_cache[query] = (now + self._q_cache_ttl, value)
+            return value
 
         except Exception as e:
             logger.warning("Prometheus instant query failed. query=%s err=%s", query, e)
             return None
 
+    def _instant_queries(self, queries: List[str]) -> List[Optional[float]]:
+        """
+        Run several independent instant queries concurrently.
+        Returns results in input order; failures map to None as usual.
+        """
+        if not self.enabled:
+            return [None] * len(queries)
+        return list(_QUERY_POOL.map(self._instant_query, queries))
+
     def _safe_int(self, v: Optional[float]) -> int:
         return int(v) if v is not None else 0
 
@@ -137,15 +226,10 @@ class PrometheusClient:
                 "source": "dummy_local",
             }
 
-        sel = f'namespace="{namespace}",deployment="{deployment}"'
-
-        desired_q = f"max(kube_deployment_spec_replicas{{{sel}}})"
-        ready_q = f"max(kube_deployment_status_replicas_ready{{{sel}}})"
-        avail_q = f"max(kube_deployment_status_replicas_available{{{sel}}})"
-
-        desired = self._instant_query(desired_q)
-        ready = self._instant_query(ready_q)
-        available = self._instant_query(avail_q)
+        # One RTT instead of three: the queries are independent
+        desired, ready, available = self._instant_queries(
+            list(_deployment_queries(namespace, deployment))
+        )
 
         desired_i = self._safe_int(desired)
         ready_i = self._safe_int(ready)
@@ -163,6 +247,50 @@ class PrometheusClient:
             "source": "kube_state_metrics",
         }
 
+    def get_deployments_health(
+        self,
+        namespace: str,
+        deployments: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Health for several deployments in one concurrent fan-out.
+
+        The summary page needs N health cards; batching all 3*N instant
+        queries into a single _instant_queries call keeps the page cost
+        at one RTT no matter how many deployments it shows.
+        """
+        if not self.enabled:
+            return {
+                d: self.get_deployment_health(namespace, d)
+                for d in deployments
+            }
+
+        queries: List[str] = []
+        for deployment in deployments:
+            queries.extend(_deployment_queries(namespace, deployment))
+
+        values = self._instant_queries(queries)
+
+        out: Dict[str, Dict[str, Any]] = {}
+        for i, deployment in enumerate(deployments):
+            desired, ready, available = values[3 * i : 3 * i + 3]
+
+            desired_i = self._safe_int(desired)
+            ready_i = self._safe_int(ready)
+            avail_i = self._safe_int(available)
+
+            out[deployment] = {
+                "namespace": namespace,
+                "deployment": deployment,
+                "replicas_desired": desired_i,
+                "replicas_ready": ready_i,
+                "replicas_available": avail_i,
+                "status": "healthy" if (desired_i > 0 and ready_i >= desired_i) else "degraded",
+                "source": "kube_state_metrics",
+            }
+
+        return out
+
     # -------------------------------
     # ERP Pilot KPIs (Odoo via ingress-nginx)
     # -------------------------------
@@ -228,9 +356,11 @@ class PrometheusClient:
         )
         """
 
-        req_rate = self._safe_float(self._instant_query(req_rate_q))
-        err_5xx = self._safe_float(self._instant_query(err_5xx_q))
-        p95_s = self._instant_query(p95_latency_s_q)
+        req_rate_v, err_5xx_v, p95_s = self._instant_queries(
+            [req_rate_q, err_5xx_q, p95_latency_s_q]
+        )
+        req_rate = self._safe_float(req_rate_v)
+        err_5xx = self._safe_float(err_5xx_v)
         p95_ms = int(p95_s * 1000) if (p95_s is not None and p95_s > 0) else 0
 
         return {
@@ -264,27 +394,25 @@ class PrometheusClient:
         if sel:
             sel = "{" + sel + "}"
 
-        candidate_bucket_metrics = [
-            # common HTTP-style
-            "http_request_duration_seconds_bucket",
-            "http_server_duration_seconds_bucket",
-            "http_duration_seconds_bucket",
-            # common custom
-            "request_duration_seconds_bucket",
-            "requests_duration_seconds_bucket",
-            # generic
-            "duration_seconds_bucket",
-        ]
-
-        for metric in candidate_bucket_metrics:
-            q = (
-                f"histogram_quantile(0.95, "
-                f"sum(rate({metric}{sel}[5m])) by (le)"
-                f")"
-            )
-            val = self._instant_query(q)
+        # Try the known-good metric first (usually the only query needed)
+        known = self._known_latency_tpl
+        templates = _LATENCY_QUERY_TEMPLATES
+        if known is not None:
+            templates = (known,) + tuple(t for t in templates if t != known)
+
+        for tpl in templates:
+            val = self._instant_query(tpl.format(sel=sel))
             if val is not None and val > 0:
+                self._known_latency_tpl = tpl
+                self._known_latency_misses = 0
                 # seconds -> ms
                 return int(val * 1000)
+            if tpl is known:
+                # Evict after two consecutive misses so a renamed or
+                # dropped metric doesn't pin the probe order forever
+                self._known_latency_misses += 1
+                if self._known_latency_misses >= 2:
+                    self._known_latency_tpl = None
+                    self._known_latency_misses = 0
 
         return None
\ No newline at end of file
@@ -28,6 +28,15 @@ class OrchestratorClient:
 
         self.base_url = (orch_url or default_url).rstrip("/")
 
+        # Pooled keep-alive session so repeated dashboard calls reuse
+        # one TCP connection instead of handshaking per request
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=0
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         logger.info(f"OrchestratorClient initialized with base URL: {self.base_url}")
 
     # ------------------------------------------------------------------
@@ -41,7 +50,7 @@ class OrchestratorClient:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            resp = requests.post(url, json=payload, timeout=5)
+            resp = self._session.post(url, json=payload, timeout=5)
             resp.raise_for_status()
             return resp.json()
 
@@ -66,7 +75,7 @@ class OrchestratorClient:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            resp = requests.get(url, timeout=5)
+            resp = self._session.get(url, timeout=5)
             resp.raise_for_status()
             return resp.json()
 
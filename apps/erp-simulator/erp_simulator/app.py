@@ -14,14 +14,18 @@ Now includes:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import random
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Literal, Optional, Dict, Any
 
 from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from opentelemetry import trace
 
@@ -87,6 +91,15 @@ MODES_ENABLED_GAUGE = Gauge(
     registry=PROM_REGISTRY,
 )
 
+MEMORY_LEAK_CURRENT_BYTES = Gauge(
+    "erp_simulator_memory_leak_current_bytes",
+    "Bytes currently retained by the simulated memory leak",
+    registry=PROM_REGISTRY,
+)
+
+# Label child resolved once; /simulate/load is the only error site
+_LOAD_ERROR_COUNTER = ERROR_COUNTER.labels(endpoint="/simulate/load")
+
 # -----------------------------
 # OpenTelemetry Instrumentation
 # -----------------------------
@@ -134,10 +147,74 @@ SIM_MODES: Dict[str, bool] = {
     "error_burst": settings.error_burst_enabled,
 }
 
-MEMORY_LEAK_BUCKET: list[bytes] = []
+# Bitmask mirror of SIM_MODES for the hot checks: one int AND per test
+# instead of a dict hash lookup per mode per request
+MEM_LEAK_BIT = 1
+CPU_SPIKE_BIT = 2
+JITTER_BIT = 4
+ERR_BURST_BIT = 8
+
+_MODE_BITS = {
+    "memory_leak": MEM_LEAK_BIT,
+    "cpu_spike": CPU_SPIKE_BIT,
+    "latency_jitter": JITTER_BIT,
+    "error_burst": ERR_BURST_BIT,
+}
+
+
+def _modes_to_bits() -> int:
+    bits = 0
+    for name, bit in _MODE_BITS.items():
+        if SIM_MODES[name]:
+            bits |= bit
+    return bits
+
+
+_MODES_BITS = _modes_to_bits()
+
+# Bounded ring: old chunks are evicted once the cap is reached, so a
+# long-running simulator has predictable RSS instead of unbounded
+# growth and GC-pause jitter in the load results
+MEMORY_LEAK_BUCKET: deque[bytes] = deque(
+    maxlen=int(os.getenv("SIM_LEAK_MAX_CHUNKS", "1024"))
+)
+_leak_current_bytes = 0
+
+# Allocated once: leak sites slice this (a single memcpy) instead of
+# building and filling a fresh b"x" * N buffer per hit
+_LEAK_TEMPLATE = b"x" * (1 << 20)
+
+
+def _leak_append(chunk: bytes) -> None:
+    global _leak_current_bytes
+    if len(MEMORY_LEAK_BUCKET) == MEMORY_LEAK_BUCKET.maxlen:
+        _leak_current_bytes -= len(MEMORY_LEAK_BUCKET[0])
+    MEMORY_LEAK_BUCKET.append(chunk)
+    _leak_current_bytes += len(chunk)
+    MEMORY_LEAK_CURRENT_BYTES.set(_leak_current_bytes)
+
+
+def _leak_reset() -> int:
+    global _leak_current_bytes
+    freed = _leak_current_bytes
+    MEMORY_LEAK_BUCKET.clear()
+    _leak_current_bytes = 0
+    MEMORY_LEAK_CURRENT_BYTES.set(0)
+    return freed
 
 _bg_task: Optional[asyncio.Task] = None
 
+# Private RNG: the module-level random functions share one Mersenne
+# Twister behind the module lock, which contends under concurrent load
+_RNG = random.Random()
+
+# CPU burns run in worker processes so the event loop (and with it
+# /healthz, /metrics and OTEL export) stays responsive under load.
+# The semaphore caps in-flight burns at the core count so a burst of
+# simulate_load calls queues instead of oversubscribing the host.
+_BURN_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+_BURN_SEMAPHORE = asyncio.Semaphore(os.cpu_count() or 1)
+
 # ---------------------------------------------------------------------------
 # Logging & Tracing
 # ---------------------------------------------------------------------------
@@ -154,20 +231,53 @@ tracer = trace.get_tracer(__name__)
 def _update_modes_gauge() -> None:
     active = sum(1 for v in SIM_MODES.values() if v)
     MODES_ENABLED_GAUGE.set(active)
-    logger.info("Updated modes gauge, active=%d, SIM_MODES=%s", active, SIM_MODES)
+    # Debug only: the dict repr is not worth formatting on every toggle
+    logger.debug("Updated modes gauge, active=%d, SIM_MODES=%s", active, SIM_MODES)
+
+
+def _spin_python(n: int) -> int:
+    # Busy PRNG so the work can't be optimized away
+    x = 1
+    for _ in range(n):
+        x = (x * 1103515245 + 12345) & 0x7FFFFFFF
+    return x
+
+
+try:
+    from numba import njit
+    _spin = njit(cache=True, nogil=True)(_spin_python)
+    _spin(1)  # trigger compilation at import, not mid-request
+except ImportError:  # numba is optional; the Python loop still works
+    _spin = _spin_python
 
 
 def _cpu_burn(duration_seconds: float) -> float:
     """
     Busy-loop CPU for approximately duration_seconds.
     Returns the actual elapsed time.
+
+    The batch keeps the loop compute-bound: one monotonic clock read
+    per batch instead of a clock syscall per iteration, with the batch
+    size auto-tuned toward ~1 ms of work so the loop lands within
+    about a millisecond of the deadline regardless of host speed. With
+    numba installed the batch runs as a compiled nogil kernel, so the
+    simulated load is genuinely compute-bound rather than
+    interpreter-bound.
     """
-    start = time.time()
-    x = 0
-    while (time.time() - start) < duration_seconds:
-        x += 1  # simple CPU work
-    end = time.time()
-    return end - start
+    # Integer nanoseconds: perf_counter_ns hits the vDSO fast path and
+    # the loop avoids FP conversions until the final return
+    start = time.perf_counter_ns()
+    deadline = start + int(duration_seconds * 1e9)
+    n = 10_000
+    while True:
+        t0 = time.perf_counter_ns()
+        if t0 >= deadline:
+            return (t0 - start) / 1e9
+        _spin(n)
+        batch = time.perf_counter_ns() - t0
+        if batch > 0:
+            # Tune toward ~1 ms (1_000_000 ns) of work per batch
+            n = max(1_000, min(n * 1_000_000 // batch, 100_000_000))
 
 
 async def _background_worker() -> None:
@@ -175,29 +285,51 @@ async def _background_worker() -> None:
     Background task that periodically applies anomaly patterns
     (small CPU spikes, memory allocations) when modes are enabled.
     """
+    loop = asyncio.get_running_loop()
+    period = 5.0
+    next_tick = loop.time() + period
     while True:
         try:
-            with tracer.start_as_current_span("erp_simulator.background_worker") as span:
-                span.set_attribute("sim.mode.memory_leak", SIM_MODES["memory_leak"])
-                span.set_attribute("sim.mode.cpu_spike", SIM_MODES["cpu_spike"])
+            # The worker only acts on memory_leak and cpu_spike; when
+            # neither is enabled, skip the span (and its OTLP export)
+            # entirely and just poll cheaply until one is switched on
+            if not _MODES_BITS & (MEM_LEAK_BIT | CPU_SPIKE_BIT):
+                await asyncio.sleep(1.0)
+                next_tick = loop.time() + period
+                continue
 
-                # Small periodic CPU burn
-                if SIM_MODES["cpu_spike"]:
-                    with CPU_BURN_HIST.time():
-                        elapsed = _cpu_burn(0.1)
-                        span.set_attribute("sim.cpu_burn_ms", elapsed * 1000.0)
+            with tracer.start_as_current_span("erp_simulator.background_worker") as span:
+                span.set_attributes({
+                    "sim.mode.memory_leak": bool(_MODES_BITS & MEM_LEAK_BIT),
+                    "sim.mode.cpu_spike": bool(_MODES_BITS & CPU_SPIKE_BIT),
+                })
+
+                # Small periodic CPU burn (off the event loop)
+                if _MODES_BITS & CPU_SPIKE_BIT:
+                    burn_started_ns = time.perf_counter_ns()
+                    elapsed = await asyncio.get_running_loop().run_in_executor(
+                        _BURN_POOL, _cpu_burn, 0.1
+                    )
+                    CPU_BURN_HIST.observe(
+                        (time.perf_counter_ns() - burn_started_ns) / 1e6
+                    )
+                    span.set_attribute("sim.cpu_burn_ms", elapsed * 1000.0)
 
                 # Small periodic memory growth
-                if SIM_MODES["memory_leak"]:
-                    leak_bytes = random.randint(50_000, 200_000)
-                    MEMORY_LEAK_BUCKET.append(b"x" * leak_bytes)
+                if _MODES_BITS & MEM_LEAK_BIT:
+                    leak_bytes = _RNG.randint(50_000, 200_000)
+                    _leak_append(_LEAK_TEMPLATE[:leak_bytes])
                     MEMORY_LEAK_BYTES.inc(leak_bytes)
                     span.set_attribute("sim.memory_allocated_bytes", leak_bytes)
 
-            await asyncio.sleep(5.0)
+            # Sleep until the next absolute tick so the work done above
+            # doesn't push the cadence later every iteration
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            next_tick += period
         except Exception:
             logger.exception("Background worker encountered an error")
-            await asyncio.sleep(5.0)
+            await asyncio.sleep(period)
+            next_tick = loop.time() + period
 
 
 # ---------------------------------------------------------------------------
@@ -208,6 +340,7 @@ app = FastAPI(
     title="SmartOps ERP Simulator",
     description="Simulated ERP workload service for SmartOps testing.",
     version="0.2.0",
+    default_response_class=ORJSONResponse,
 )
 
 # OTEL auto instrumentation
@@ -218,10 +351,56 @@ configure_otel(
 )
 
 
+class _HealthShortcut:
+    """
+    Pure-ASGI bypass for the k8s liveness probe: answer /healthz with a
+    precomputed body before routing, OTEL spans or the Prometheus
+    middleware run. Probes hit every replica at ~1 Hz, so this keeps
+    them allocation-free.
+    """
+
+    _BODY = json.dumps(
+        {"status": "ok", "app": settings.app_name, "env": settings.environment}
+    ).encode()
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/healthz":
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            })
+            await send({"type": "http.response.body", "body": self._BODY})
+            return
+        await self.app(scope, receive, send)
+
+
+# Pre-bound counter children per (method, path): .labels() does dict
+# lookups and label validation on every call, which is measurable on
+# tiny handlers like /healthz at high RPS
+_ROUTE_COUNTERS: Dict[tuple, Any] = {}
+
+
+def _prebind_route_counters() -> None:
+    for route in app.routes:
+        path = getattr(route, "path", None)
+        methods = getattr(route, "methods", None) or ()
+        if not path:
+            continue
+        for method in methods:
+            _ROUTE_COUNTERS[(method, path)] = REQUEST_COUNTER.labels(
+                method=method, endpoint=path
+            )
+
+
 @app.on_event("startup")
 async def on_startup() -> None:
     global _bg_task
     logger.info("Starting ERP Simulator with SIM_MODES=%s", SIM_MODES)
+    _prebind_route_counters()
     _update_modes_gauge()
     if _bg_task is None:
         _bg_task = asyncio.create_task(_background_worker())
@@ -231,22 +410,28 @@ async def on_startup() -> None:
 # Prometheus /metrics endpoint
 # ---------------------------------------------------------------------------
 
+# Scrape cache: generate_latest walks every collector and formats
+# text; concurrent scrapers within the TTL share one rendering
+_METRICS_CACHE = {"ts": 0.0, "data": b""}
+_METRICS_CACHE_TTL = 1.0
+_METRICS_LOCK = asyncio.Lock()
+
+
 @app.get("/metrics")
-def metrics() -> Response:
-    data = generate_latest(PROM_REGISTRY)
-    return Response(data, media_type=CONTENT_TYPE_LATEST)
+async def metrics() -> Response:
+    if time.monotonic() - _METRICS_CACHE["ts"] > _METRICS_CACHE_TTL:
+        async with _METRICS_LOCK:
+            # Re-check under the lock so a herd regenerates once
+            if time.monotonic() - _METRICS_CACHE["ts"] > _METRICS_CACHE_TTL:
+                _METRICS_CACHE["data"] = generate_latest(PROM_REGISTRY)
+                _METRICS_CACHE["ts"] = time.monotonic()
+    return Response(_METRICS_CACHE["data"], media_type=CONTENT_TYPE_LATEST)
 
 
 # ---------------------------------------------------------------------------
 # Models
 # ---------------------------------------------------------------------------
 
-class HealthResponse(BaseModel):
-    status: str
-    app: str
-    env: str
-
-
 class LoadSimulationRequest(BaseModel):
     duration_seconds: float = Field(
         0.5,
@@ -257,19 +442,9 @@ class LoadSimulationRequest(BaseModel):
     target: Optional[str] = "cpu"
 
 
-class LoadSimulationResponse(BaseModel):
-    message: str
-    duration_seconds: float
-    target: str
-
-
-class ChaosModeResponse(BaseModel):
-    modes: Dict[str, bool]
-
-
-class ChaosToggleResponse(BaseModel):
-    mode: str
-    enabled: bool
+# Responses are plain dicts serialized straight by ORJSONResponse: with
+# response_model set, FastAPI re-validates every response through
+# Pydantic, which is pure overhead for these fixed-shape payloads
 
 
 # ---------------------------------------------------------------------------
@@ -278,11 +453,23 @@ class ChaosToggleResponse(BaseModel):
 
 @app.middleware("http")
 async def prometheus_middleware(request: Request, call_next):
-    REQUEST_COUNTER.labels(method=request.method, endpoint=request.url.path).inc()
+    # scope["path"] is already a str; request.url.path would build a
+    # URL object per request. Known routes hit the pre-bound child.
+    path = request.scope["path"]
+    counter = _ROUTE_COUNTERS.get((request.method, path))
+    if counter is None:
+        counter = REQUEST_COUNTER.labels(method=request.method, endpoint=path)
+    counter.inc()
     response = await call_next(request)
     return response
 
 
+# Registered last so it sits outermost in the middleware stack
+# (add_middleware prepends) and short-circuits before the Prometheus
+# middleware and the instrumentation wrappers
+app.add_middleware(_HealthShortcut)
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -302,17 +489,17 @@ def test_trace() -> dict:
     }
 
 
-@app.get("/healthz", response_model=HealthResponse, tags=["internal"])
-def healthz() -> HealthResponse:
-    return HealthResponse(
-        status="ok",
-        app=settings.app_name,
-        env=settings.environment,
-    )
+@app.get("/healthz", tags=["internal"])
+def healthz() -> Dict[str, str]:
+    return {
+        "status": "ok",
+        "app": settings.app_name,
+        "env": settings.environment,
+    }
 
 
-@app.post("/simulate/load", response_model=LoadSimulationResponse, tags=["simulation"])
-def simulate_load(payload: LoadSimulationRequest) -> LoadSimulationResponse:
+@app.post("/simulate/load", tags=["simulation"])
+async def simulate_load(payload: LoadSimulationRequest) -> Dict[str, Any]:
     """
     Simulate a request that can exhibit multiple anomaly modes:
 
@@ -324,116 +511,143 @@ def simulate_load(payload: LoadSimulationRequest) -> LoadSimulationResponse:
     if payload.duration_seconds < 0:
         raise HTTPException(400, "duration_seconds must be positive")
 
-    with tracer.start_as_current_span("erp_simulator.simulate_load") as span, LOAD_DURATION.time():
-        span.set_attribute("sim.mode.memory_leak", SIM_MODES["memory_leak"])
-        span.set_attribute("sim.mode.cpu_spike", SIM_MODES["cpu_spike"])
-        span.set_attribute("sim.mode.latency_jitter", SIM_MODES["latency_jitter"])
-        span.set_attribute("sim.mode.error_burst", SIM_MODES["error_burst"])
-
-        # 1) Latency jitter
-        jitter_ms = 0.0
-        if SIM_MODES["latency_jitter"]:
-            jitter_ms = random.uniform(0, settings.max_extra_latency_ms)
+    # Accumulate metric updates locally and flush once on exit: each
+    # inc()/observe() takes a lock, so the hot handler pays for them a
+    # single time instead of mid-flight
+    jitter_ms = 0.0
+    leak_bytes = 0
+    burn_ns = 0
+    error_injected = False
+    started_ns = time.perf_counter_ns()
+
+    try:
+        # One bitmask read covers the whole request: mid-flight chaos
+        # toggles apply from the next request on
+        modes = _MODES_BITS
+
+        with tracer.start_as_current_span("erp_simulator.simulate_load") as span:
+            # Each set_attribute round-trips through the SDK's attribute
+            # validation, so batch them: one call up front for the mode
+            # flags and one at the end for the request outcome
+            span.set_attributes({
+                "sim.mode.memory_leak": bool(modes & MEM_LEAK_BIT),
+                "sim.mode.cpu_spike": bool(modes & CPU_SPIKE_BIT),
+                "sim.mode.latency_jitter": bool(modes & JITTER_BIT),
+                "sim.mode.error_burst": bool(modes & ERR_BURST_BIT),
+            })
+
+            # 1) Latency jitter
+            if modes & JITTER_BIT:
+                jitter_ms = _RNG.uniform(0, settings.max_extra_latency_ms)
+                await asyncio.sleep(jitter_ms / 1000.0)
+
+            # 2) Memory leak
+            if modes & MEM_LEAK_BIT:
+                leak_bytes = _RNG.randint(100_000, 1_000_000)
+                _leak_append(_LEAK_TEMPLATE[:leak_bytes])
+
+            # 3) CPU load (base + optional spike)
+            cpu_duration = payload.duration_seconds
+            if modes & CPU_SPIKE_BIT:
+                cpu_duration += 0.5  # simple extra burn for spike
+
+            # Burn in a worker process: N concurrent simulations load N
+            # cores instead of serializing on the GIL in this process
+            async with _BURN_SEMAPHORE:
+                # Timed inside the semaphore: the histogram should record
+                # the burn itself, not time queued behind other requests
+                burn_started_ns = time.perf_counter_ns()
+                elapsed = await asyncio.get_running_loop().run_in_executor(
+                    _BURN_POOL, _cpu_burn, cpu_duration
+                )
+                burn_ns = time.perf_counter_ns() - burn_started_ns
+
+            # 4) Error burst
+            error_rate = settings.base_error_rate
+            if modes & ERR_BURST_BIT:
+                error_rate = max(error_rate, 0.4)  # bump to at least 40%
+
+            error_injected = _RNG.random() < error_rate
+
+            span.set_attributes({
+                "sim.cpu_burn_ms": elapsed * 1000.0,
+                "sim.extra_delay_ms": jitter_ms,
+                "sim.memory_allocated_bytes": leak_bytes,
+                "sim.error_injected": error_injected,
+            })
+
+            if error_injected:
+                logger.warning("Simulated error burst triggered")
+                raise HTTPException(status_code=500, detail="Simulated error burst")
+    finally:
+        # ns -> unit conversions happen only here, at observe time
+        LOAD_DURATION.observe((time.perf_counter_ns() - started_ns) / 1e9)
+        if jitter_ms:
             LATENCY_JITTER_HIST.observe(jitter_ms)
-            span.set_attribute("sim.extra_delay_ms", jitter_ms)
-            time.sleep(jitter_ms / 1000.0)
-
-        # 2) Memory leak
-        if SIM_MODES["memory_leak"]:
-            leak_bytes = random.randint(100_000, 1_000_000)
-            MEMORY_LEAK_BUCKET.append(b"x" * leak_bytes)
+        if leak_bytes:
             MEMORY_LEAK_BYTES.inc(leak_bytes)
-            span.set_attribute("sim.memory_allocated_bytes", leak_bytes)
-
-        # 3) CPU load (base + optional spike)
-        cpu_duration = payload.duration_seconds
-        if SIM_MODES["cpu_spike"]:
-            cpu_duration += 0.5  # simple extra burn for spike
-
-        with CPU_BURN_HIST.time():
-            elapsed = _cpu_burn(cpu_duration)
-            span.set_attribute("sim.cpu_burn_ms", elapsed * 1000.0)
-
-        # 4) Error burst
-        error_rate = settings.base_error_rate
-        if SIM_MODES["error_burst"]:
-            error_rate = max(error_rate, 0.4)  # bump to at least 40%
-
-        if random.random() < error_rate:
-            ERROR_COUNTER.labels(endpoint="/simulate/load").inc()
-            span.set_attribute("sim.error_injected", True)
-            logger.warning("Simulated error burst triggered")
-            raise HTTPException(status_code=500, detail="Simulated error burst")
-
-        # Normal success
-        span.set_attribute("sim.error_injected", False)
-
-    return LoadSimulationResponse(
-        message="Load simulation completed",
-        duration_seconds=payload.duration_seconds,
-        target=payload.target or "cpu",
-    )
+        if burn_ns:
+            CPU_BURN_HIST.observe(burn_ns / 1e6)
+        if error_injected:
+            _LOAD_ERROR_COUNTER.inc()
+
+    return {
+        "message": "Load simulation completed",
+        "duration_seconds": payload.duration_seconds,
+        "target": payload.target or "cpu",
+    }
 
 
 # ---------------------------------------------------------------------------
 # Chaos control endpoints
 # ---------------------------------------------------------------------------
 
-@app.get("/chaos/modes", response_model=ChaosModeResponse, tags=["chaos"])
-def get_modes() -> ChaosModeResponse:
+@app.get("/chaos/modes", tags=["chaos"])
+def get_modes() -> Dict[str, Dict[str, bool]]:
     """
     Return the current anomaly mode configuration.
     """
-    return ChaosModeResponse(modes=SIM_MODES.copy())
+    return {"modes": SIM_MODES.copy()}
 
 
-def _set_mode(mode: str, enabled: bool) -> ChaosToggleResponse:
+def _set_mode(mode: str, enabled: bool) -> Dict[str, Any]:
+    global _MODES_BITS
     if mode not in SIM_MODES:
         raise HTTPException(status_code=400, detail=f"Unknown mode: {mode}")
     SIM_MODES[mode] = enabled
+    _MODES_BITS = _modes_to_bits()
     _update_modes_gauge()
     logger.info("Chaos mode %s set to %s", mode, enabled)
-    return ChaosToggleResponse(mode=mode, enabled=enabled)
-
-
-@app.post("/chaos/memory-leak/enable", response_model=ChaosToggleResponse, tags=["chaos"])
-def enable_memory_leak() -> ChaosToggleResponse:
-    return _set_mode("memory_leak", True)
-
-
-@app.post("/chaos/memory-leak/disable", response_model=ChaosToggleResponse, tags=["chaos"])
-def disable_memory_leak() -> ChaosToggleResponse:
-    return _set_mode("memory_leak", False)
-
-
-@app.post("/chaos/cpu-spike/enable", response_model=ChaosToggleResponse, tags=["chaos"])
-def enable_cpu_spike() -> ChaosToggleResponse:
-    return _set_mode("cpu_spike", True)
-
+    return {"mode": mode, "enabled": enabled}
 
-@app.post("/chaos/cpu-spike/disable", response_model=ChaosToggleResponse, tags=["chaos"])
-def disable_cpu_spike() -> ChaosToggleResponse:
-    return _set_mode("cpu_spike", False)
 
-
-@app.post("/chaos/latency-jitter/enable", response_model=ChaosToggleResponse, tags=["chaos"])
-def enable_latency_jitter() -> ChaosToggleResponse:
-    return _set_mode("latency_jitter", True)
-
-
-@app.post("/chaos/latency-jitter/disable", response_model=ChaosToggleResponse, tags=["chaos"])
-def disable_latency_jitter() -> ChaosToggleResponse:
-    return _set_mode("latency_jitter", False)
-
-
-@app.post("/chaos/error-burst/enable", response_model=ChaosToggleResponse, tags=["chaos"])
-def enable_error_burst() -> ChaosToggleResponse:
-    return _set_mode("error_burst", True)
+@app.post("/chaos/memory-leak/reset", tags=["chaos"])
+def reset_memory_leak() -> dict:
+    """
+    Drop all retained leak chunks and zero the gauge.
+    """
+    freed = _leak_reset()
+    logger.info("Memory leak bucket reset, freed=%d bytes", freed)
+    return {"status": "ok", "freed_bytes": freed}
+
+
+# URL slugs -> SIM_MODES keys. One parameterized route replaces the
+# eight near-identical enable/disable handlers while serving the exact
+# same URLs (and a smaller route table to scan per request).
+_MODE_BY_SLUG = {
+    "memory-leak": "memory_leak",
+    "cpu-spike": "cpu_spike",
+    "latency-jitter": "latency_jitter",
+    "error-burst": "error_burst",
+}
 
 
-@app.post("/chaos/error-burst/disable", response_model=ChaosToggleResponse, tags=["chaos"])
-def disable_error_burst() -> ChaosToggleResponse:
-    return _set_mode("error_burst", False)
+@app.post("/chaos/{mode}/{action}", tags=["chaos"])
+def toggle_mode(mode: str, action: Literal["enable", "disable"]) -> Dict[str, Any]:
+    internal = _MODE_BY_SLUG.get(mode)
+    if internal is None:
+        raise HTTPException(status_code=400, detail=f"Unknown mode: {mode}")
+    return _set_mode(internal, action == "enable")
 
 
 # ---------------------------------------------------------------------------
@@ -19,6 +19,7 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExport
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.requests import RequestsInstrumentor
@@ -45,7 +46,7 @@ def configure_otel(app: FastAPI, service_name: str, environment: str) -> None:
     # OTLP gRPC exporter expects host:port (no http:// or https://)
     clean_endpoint = raw_endpoint.replace("http://", "").replace("https://", "")
 
-    logger.info(f"[OTEL] Configuring OTLP gRPC exporter → {clean_endpoint}")
+    logger.info("[OTEL] Configuring OTLP gRPC exporter → %s", clean_endpoint)
 
     # ------------------------------------------------------------------
     # 2. Resource attributes
@@ -62,7 +63,16 @@ def configure_otel(app: FastAPI, service_name: str, environment: str) -> None:
     # ------------------------------------------------------------------
     # 3. Tracer provider
     # ------------------------------------------------------------------
-    provider = TracerProvider(resource=resource)
+    # Optional head sampling: OTEL_TRACES_SAMPLER_ARG < 1.0 keeps that
+    # ratio of new traces while still honouring sampled parents
+    sample_ratio = float(os.getenv("OTEL_TRACES_SAMPLER_ARG", "1.0"))
+    if sample_ratio < 1.0:
+        provider = TracerProvider(
+            resource=resource,
+            sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+        )
+    else:
+        provider = TracerProvider(resource=resource)
     trace.set_tracer_provider(provider)
 
     # ------------------------------------------------------------------
@@ -73,7 +83,14 @@ def configure_otel(app: FastAPI, service_name: str, environment: str) -> None:
         insecure=True,
     )
 
-    span_processor = BatchSpanProcessor(span_exporter)
+    # Larger queue and batches: the simulator produces spans in bursts
+    # under load tests, and the defaults drop spans once the queue fills
+    span_processor = BatchSpanProcessor(
+        span_exporter,
+        max_queue_size=8192,
+        schedule_delay_millis=1000,
+        max_export_batch_size=1024,
+    )
     provider.add_span_processor(span_processor)
 
     # ------------------------------------------------------------------
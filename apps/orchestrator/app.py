@@ -1,5 +1,6 @@
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from prometheus_fastapi_instrumentator import Instrumentator
 
@@ -25,42 +26,47 @@ async def lifespan(app: FastAPI):
     # Startup logic: Start the closed-loop background processor
     print("Starting SmartOps Orchestrator lifespan...")
     await closed_loop_manager.start()
-    
+
     yield  # The app is now running and receiving requests
-    
+
     # Shutdown logic (optional: add cleanup here)
     print("Shutting down SmartOps Orchestrator...")
 
 # ------------------------------------------------------------------
-# App Initialization
+# App Factory
 # ------------------------------------------------------------------
-app = FastAPI(
-    title="SmartOps Orchestrator",
-    description="Executes AI + policy-driven Kubernetes actions",
-    version="0.1.0",
-    lifespan=lifespan  # Register the lifespan handler here
-)
+def create_app() -> FastAPI:
+    """Build the orchestrator app with instrumentation and routers wired once."""
+    app = FastAPI(
+        title="SmartOps Orchestrator",
+        description="Executes AI + policy-driven Kubernetes actions",
+        version="0.1.0",
+        lifespan=lifespan,  # Register the lifespan handler here
+        default_response_class=ORJSONResponse,  # C-backed JSON serialization
+    )
 
-# ------------------------------------------------------------------
-# Instrumentation & Routers
-# ------------------------------------------------------------------
-setup_otel(app)
-Instrumentator().instrument(app)
-app.include_router(metrics_router)
+    setup_otel(app)
+    Instrumentator().instrument(app)
+    app.include_router(metrics_router)
+
+    # Business Routers
+    app.include_router(orchestrator_router, prefix="/v1")
+    app.include_router(k8s_router, prefix="/v1")
+    app.include_router(verification_router, prefix="/v1")
+    app.include_router(signals_router, prefix="/v1")
+
+    @app.get("/healthz")
+    def health_check():
+        return {"status": "ok", "service": "orchestrator"}
+
+    return app
 
-# Business Routers
-app.include_router(orchestrator_router, prefix="/v1")
-app.include_router(k8s_router, prefix="/v1")
-app.include_router(verification_router, prefix="/v1")
-app.include_router(signals_router, prefix="/v1")
 
-@app.get("/healthz")
-def health_check():
-    return {"status": "ok", "service": "orchestrator"}
+app = create_app()
 
 # ------------------------------------------------------------------
 # Uvicorn Runner - This allows 'python -m apps.orchestrator.app' to work
 # ------------------------------------------------------------------
 if __name__ == "__main__":
     # Using the string import 'apps.orchestrator.app:app' is better for Windows reload support
-    uvicorn.run("apps.orchestrator.app:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run("apps.orchestrator.app:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,12 +1,37 @@
+import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 
+logger = logging.getLogger("smartops.config")
 
+# Frozenset membership is O(1); mirrors the truthy-set used by the
+# closed-loop env helpers
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.environ.get(name, str(default)).strip().lower() in _TRUTHY
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, str(default)).strip()
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("Invalid int env %s=%r, using default=%d", name, raw, default)
+        return default
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
     Centralized orchestrator configuration.
 
     Backed by environment variables so we can tune behavior per environment
-    (dev / stage / prod) without changing code.
+    (dev / stage / prod) without changing code. Built once by get_settings();
+    the frozen dataclass means every later access is a plain slot read with
+    no repeated os.getenv / int() / .lower() parsing.
 
     Existing fields:
       - K8S_NAMESPACE: default Kubernetes namespace for SmartOps workloads
@@ -19,47 +44,53 @@ class Settings:
       - ORCH_ENFORCE_REPLICA_GUARDRAILS: enable/disable replica guardrails
     """
 
-    # ------------------------------------------------------------------
-    # Base orchestrator settings
-    # ------------------------------------------------------------------
-    K8S_NAMESPACE: str = os.getenv("SMARTOPS_NAMESPACE", "smartops-dev")
-    LOG_LEVEL: str = os.getenv("ORCH_LOG_LEVEL", "INFO")
+    K8S_NAMESPACE: str
+    LOG_LEVEL: str
 
     # Keep the original attribute name for backward compatibility
-    OTel_Endpoint: str = os.getenv(
-        "OTEL_EXPORTER_OTLP_ENDPOINT",
-        "http://smartops-otelcol:4317",
-    )
-
-    # Optional alias with a more conventional name (non-breaking)
-    @property
-    def OTEL_ENDPOINT(self) -> str:
-        return self.OTel_Endpoint
+    OTel_Endpoint: str
 
-    # ------------------------------------------------------------------
-    # Guardrails: global replica limits (Step 1)
-    # ------------------------------------------------------------------
     # Minimum allowed replicas for any SCALE operation. Typically 1,
     # but can be set to 0 in some environments for complete scale-down.
-    ORCH_MIN_REPLICAS: int = int(os.getenv("ORCH_MIN_REPLICAS", "1"))
+    ORCH_MIN_REPLICAS: int
 
     # Maximum allowed replicas for any SCALE operation. Protects the
     # cluster from runaway scaling (e.g., bad AI policy or bug).
-    ORCH_MAX_REPLICAS: int = int(os.getenv("ORCH_MAX_REPLICAS", "10"))
+    ORCH_MAX_REPLICAS: int
 
     # Master switch to turn replica guardrails on/off without code changes.
-    ORCH_ENFORCE_REPLICA_GUARDRAILS: bool = (
-        os.getenv("ORCH_ENFORCE_REPLICA_GUARDRAILS", "true").lower()
-        in ("1", "true", "yes", "y")
-    )
+    ORCH_ENFORCE_REPLICA_GUARDRAILS: bool
 
-    def __init__(self) -> None:
-        # Safety: ensure max >= min at runtime. If misconfigured, we
-        # clamp ORCH_MAX_REPLICAS to ORCH_MIN_REPLICAS to avoid crashes.
-        if self.ORCH_MAX_REPLICAS < self.ORCH_MIN_REPLICAS:
-            # Log message is handled by whoever configures logging;
-            # we avoid importing logging here to keep config lightweight.
-            self.ORCH_MAX_REPLICAS = self.ORCH_MIN_REPLICAS
+    # Optional alias with a more conventional name (non-breaking)
+    @property
+    def OTEL_ENDPOINT(self) -> str:
+        return self.OTel_Endpoint
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Read the environment once and return the shared Settings instance."""
+    min_replicas = _env_int("ORCH_MIN_REPLICAS", 1)
+    max_replicas = _env_int("ORCH_MAX_REPLICAS", 10)
+
+    # Safety: ensure max >= min. If misconfigured, we clamp
+    # ORCH_MAX_REPLICAS to ORCH_MIN_REPLICAS to avoid crashes.
+    if max_replicas < min_replicas:
+        max_replicas = min_replicas
+
+    return Settings(
+        K8S_NAMESPACE=os.getenv("SMARTOPS_NAMESPACE", "smartops-dev"),
+        LOG_LEVEL=os.getenv("ORCH_LOG_LEVEL", "INFO"),
+        OTel_Endpoint=os.getenv(
+            "OTEL_EXPORTER_OTLP_ENDPOINT",
+            "http://smartops-otelcol:4317",
+        ),
+        ORCH_MIN_REPLICAS=min_replicas,
+        ORCH_MAX_REPLICAS=max_replicas,
+        ORCH_ENFORCE_REPLICA_GUARDRAILS=_env_bool(
+            "ORCH_ENFORCE_REPLICA_GUARDRAILS", True
+        ),
+    )
 
 
-settings = Settings()
+settings = get_settings()
@@ -1,7 +1,7 @@
 import asyncio
 
 from services.closed_loop import closed_loop_manager
-from models.signal_models import AnomalySignal, AnomalyType
+from models.signal_models import AnomalySignal, AnomalyTypes
 
 async def main():
     print("\n=== SmartOps Closed-Loop Manual Test ===\n")
@@ -12,15 +12,24 @@ async def main():
         service="erp-simulator",        # friendly name
         isAnomaly=True,                 # required
         score=0.92,                     # required
-        type=AnomalyType.RESOURCE,      # resource anomaly → SCALE +1
+        type=AnomalyTypes.RESOURCE,      # resource anomaly → SCALE +1
         metadata={"source": "manual-test"}
     )
 
+    await closed_loop_manager.start()
+
     print("Enqueuing anomaly signal...")
-    await closed_loop_manager.enqueue_anomaly(signal)
+    done = await closed_loop_manager.enqueue_anomaly(signal)
 
     print("Waiting for closed-loop worker to process...")
-    await asyncio.sleep(15)
+    try:
+        # Returns as soon as the worker reaches a terminal outcome
+        # instead of always burning the full 15s
+        await asyncio.wait_for(done, timeout=15)
+    except asyncio.TimeoutError:
+        print("Timed out waiting for closed-loop worker.")
+
+    await closed_loop_manager.stop()
 
     print("\nTest complete.\n")
 
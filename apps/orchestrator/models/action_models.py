@@ -12,21 +12,31 @@ These models are used across:
 
 from __future__ import annotations
 
-from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Literal, Optional, Dict, Any, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from .verification_models import DeploymentVerificationResult
 
+# Shared tuning for action models: ignore unknown producer fields and
+# skip re-validating defaults. Not frozen — the closed-loop guardrails
+# rewrite ScaleParams.replicas in place when limiting scale-down steps.
+_ACTION_CONFIG = ConfigDict(extra="ignore", validate_default=False)
+
 
 # ---------------------------------------------------------------------------
 # Action Types
 # ---------------------------------------------------------------------------
 
-class ActionType(str, Enum):
-    SCALE = "scale"
-    RESTART = "restart"
-    PATCH = "patch"
+# Literal instead of Enum: faster pydantic validation and the field is
+# a plain str at runtime (no .value indirection)
+ActionType = Literal["scale", "restart", "patch"]
+
+
+class ActionTypes:
+    """Named constants for callers (replaces the old Enum members)."""
+    SCALE: ActionType = "scale"
+    RESTART: ActionType = "restart"
+    PATCH: ActionType = "patch"
 
 
 # ---------------------------------------------------------------------------
@@ -34,6 +44,8 @@ class ActionType(str, Enum):
 # ---------------------------------------------------------------------------
 
 class K8sTarget(BaseModel):
+    model_config = _ACTION_CONFIG
+
     kind: str = Field(
         ...,
         description="Kubernetes resource kind, e.g., Deployment, StatefulSet",
@@ -53,10 +65,14 @@ class K8sTarget(BaseModel):
 # ---------------------------------------------------------------------------
 
 class ScaleParams(BaseModel):
+    model_config = _ACTION_CONFIG
+
     replicas: int = Field(..., ge=0, description="Desired replica count")
 
 
 class PatchParams(BaseModel):
+    model_config = _ACTION_CONFIG
+
     patch: Dict[str, Any] = Field(
         ...,
         description="Arbitrary JSON patch/merge patch body",
@@ -78,6 +94,8 @@ class RunnerResult(BaseModel):
       - result: raw result from k8s_core (or None)
       - error: string message if failed
     """
+    model_config = _ACTION_CONFIG
+
     status: str = Field(..., description="success | failed | dry_run")
     attempts: int = Field(..., ge=0)
     duration_seconds: float = Field(..., ge=0)
@@ -93,6 +111,7 @@ class ActionRequest(BaseModel):
     """
     Generic action request that policy-engine or AI agents can send.
     """
+    model_config = _ACTION_CONFIG
 
     type: ActionType = Field(..., description="Type of action to perform")
     target: K8sTarget = Field(..., description="Target Kubernetes resource")
@@ -149,6 +168,7 @@ class ActionResult(BaseModel):
       - verification: rollout verification summary (optional)
       - warnings: optional warnings (e.g., missing replicas, degraded status)
     """
+    model_config = _ACTION_CONFIG
 
     success: bool
     message: str
@@ -169,6 +189,8 @@ class ActionResult(BaseModel):
 # ---------------------------------------------------------------------------
 
 class ScaleRequest(BaseModel):
+    model_config = _ACTION_CONFIG
+
     namespace: str
     deployment: str
     replicas: int = Field(..., ge=0)
@@ -176,6 +198,8 @@ class ScaleRequest(BaseModel):
 
 
 class RestartRequest(BaseModel):
+    model_config = _ACTION_CONFIG
+
     namespace: str
     deployment: str
     dry_run: bool = False
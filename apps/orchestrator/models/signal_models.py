@@ -1,14 +1,24 @@
-from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+# Signals are treated as immutable once ingested, so skip the pydantic
+# work that only matters for mutable models: no default re-validation,
+# silently drop unknown producer fields, and freeze instances
+_SIGNAL_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_default=False)
 
-class AnomalyType(str, Enum):
-    LATENCY = "latency"
-    ERROR = "error"
-    RESOURCE = "resource"
-    OTHER = "other"
+
+# Literal instead of Enum: pydantic validates it with a plain hashmap
+# lookup and the stored value is just a str, no member objects involved
+AnomalyType = Literal["latency", "error", "resource", "other"]
+
+
+class AnomalyTypes:
+    """Named constants for producers (replaces the old Enum members)."""
+    LATENCY: AnomalyType = "latency"
+    ERROR: AnomalyType = "error"
+    RESOURCE: AnomalyType = "resource"
+    OTHER: AnomalyType = "other"
 
 
 class AnomalySignal(BaseModel):
@@ -18,11 +28,13 @@ class AnomalySignal(BaseModel):
     Expected to be compatible with something like:
       POST /v1/anomaly/predict {windowId, features[]} → {isAnomaly, score, type, modelVersion}
     """
+    model_config = _SIGNAL_CONFIG
+
     windowId: str
     service: str = Field(..., description="Service or deployment identifier.")
     isAnomaly: bool
     score: float
-    type: AnomalyType = AnomalyType.OTHER
+    type: AnomalyType = AnomalyTypes.OTHER
     modelVersion: Optional[str] = None
     tsRange: Optional[List[str]] = Field(
         default=None,
@@ -32,6 +44,8 @@ class AnomalySignal(BaseModel):
 
 
 class RankedCause(BaseModel):
+    model_config = _SIGNAL_CONFIG
+
     svc: str
     cause: str
     probability: float
@@ -43,6 +57,8 @@ class RcaSignal(BaseModel):
 
       POST /v1/rca/diagnose {graph, signals} → {rankedCauses[], confidence, explanation}
     """
+    model_config = _SIGNAL_CONFIG
+
     windowId: str
     service: Optional[str] = None
     rankedCauses: List[RankedCause]
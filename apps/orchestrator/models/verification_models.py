@@ -1,15 +1,25 @@
-from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Literal, Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+# Verification results are read-only once built: freeze them and skip
+# default re-validation. The request stays mutable — the verification
+# router rewrites request.deployment when retrying with the resolved name.
+_VERIFICATION_REQUEST_CONFIG = ConfigDict(extra="ignore", validate_default=False)
+_VERIFICATION_RESULT_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_default=False)
 
-class VerificationStatus(str, Enum):
-    """High-level verification state for a remediation action."""
-    PENDING = "PENDING"
-    SUCCESS = "SUCCESS"
-    FAILED = "FAILED"
-    TIMED_OUT = "TIMED_OUT"
+
+# High-level verification state for a remediation action. Literal keeps
+# pydantic validation to a hashmap lookup and the value a plain str.
+VerificationStatus = Literal["PENDING", "SUCCESS", "FAILED", "TIMED_OUT"]
+
+
+class VerificationStatuses:
+    """Named constants for producers (replaces the old Enum members)."""
+    PENDING: VerificationStatus = "PENDING"
+    SUCCESS: VerificationStatus = "SUCCESS"
+    FAILED: VerificationStatus = "FAILED"
+    TIMED_OUT: VerificationStatus = "TIMED_OUT"
 
 
 class DeploymentVerificationRequest(BaseModel):
@@ -17,6 +27,8 @@ class DeploymentVerificationRequest(BaseModel):
     Request body for verifying that a given Deployment has rolled out
     successfully after a scale/restart/patch.
     """
+    model_config = _VERIFICATION_REQUEST_CONFIG
+
     namespace: Optional[str] = Field(
         default=None,
         description="Kubernetes namespace where the deployment lives. "
@@ -49,6 +61,8 @@ class DeploymentVerificationResult(BaseModel):
     Normalized result of a rollout verification check.
     This can be logged, displayed in Grafana, or fed back into AI/policy.
     """
+    model_config = _VERIFICATION_RESULT_CONFIG
+
     status: VerificationStatus
     message: str
 
@@ -1,6 +1,7 @@
 from typing import Optional, Dict, Any
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from opentelemetry import trace
 
@@ -15,11 +16,20 @@ from ..utils.name_resolver import resolve_deployment_name
 router = APIRouter(
     prefix="/k8s",
     tags=["kubernetes"],
+    default_response_class=ORJSONResponse,
 )
 
 tracer = trace.get_tracer(__name__)
 action_runner = ActionRunner()
 
+# Span attribute names, hoisted so the action handlers load interned
+# globals instead of rebuilding the literals per request
+_ATTR_TARGET = "smartops.target"
+_ATTR_REPLICAS = "smartops.replicas"
+_ATTR_DRY_RUN = "smartops.dry_run"
+_ATTR_REQUESTED_NAME = "smartops.requested_name"
+_ATTR_RESOLVED_NAME = "smartops.resolved_name"
+
 
 # ---------------------------------------------------------------------------
 # Request Models
@@ -114,11 +124,15 @@ async def scale(
     target = f"Deployment {ns}/{resolved_name}"
 
     with tracer.start_as_current_span("router.k8s.scale") as span:
-        span.set_attribute("smartops.target", target)
-        span.set_attribute("smartops.replicas", body.replicas)
-        span.set_attribute("smartops.dry_run", body.dry_run)
-        span.set_attribute("smartops.requested_name", deployment_name)
-        span.set_attribute("smartops.resolved_name", resolved_name)
+        # Batched, and skipped entirely for unsampled spans
+        if span.is_recording():
+            span.set_attributes({
+                _ATTR_TARGET: target,
+                _ATTR_REPLICAS: body.replicas,
+                _ATTR_DRY_RUN: body.dry_run,
+                _ATTR_REQUESTED_NAME: deployment_name,
+                _ATTR_RESOLVED_NAME: resolved_name,
+            })
 
         result = action_runner.run(
             action_type="scale",
@@ -162,10 +176,13 @@ async def restart(
     target = f"Deployment {ns}/{resolved_name}"
 
     with tracer.start_as_current_span("router.k8s.restart") as span:
-        span.set_attribute("smartops.target", target)
-        span.set_attribute("smartops.dry_run", dry_run)
-        span.set_attribute("smartops.requested_name", deployment_name)
-        span.set_attribute("smartops.resolved_name", resolved_name)
+        if span.is_recording():
+            span.set_attributes({
+                _ATTR_TARGET: target,
+                _ATTR_DRY_RUN: dry_run,
+                _ATTR_REQUESTED_NAME: deployment_name,
+                _ATTR_RESOLVED_NAME: resolved_name,
+            })
 
         result = action_runner.run(
             action_type="restart",
@@ -208,10 +225,13 @@ async def patch(
     target = f"Deployment {ns}/{resolved_name}"
 
     with tracer.start_as_current_span("router.k8s.patch") as span:
-        span.set_attribute("smartops.target", target)
-        span.set_attribute("smartops.dry_run", body.dry_run)
-        span.set_attribute("smartops.requested_name", deployment_name)
-        span.set_attribute("smartops.resolved_name", resolved_name)
+        if span.is_recording():
+            span.set_attributes({
+                _ATTR_TARGET: target,
+                _ATTR_DRY_RUN: body.dry_run,
+                _ATTR_REQUESTED_NAME: deployment_name,
+                _ATTR_RESOLVED_NAME: resolved_name,
+            })
 
         result = action_runner.run(
             action_type="patch",
@@ -1,12 +1,27 @@
+import asyncio
+import time
+
 from fastapi import APIRouter, Response
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 router = APIRouter(tags=["metrics"])
 
+# Scrape cache: generate_latest walks every collector per call, so
+# concurrent scrapers within the TTL share one rendering
+_METRICS_CACHE = {"ts": 0.0, "data": b""}
+_METRICS_CACHE_TTL = 1.0
+_METRICS_LOCK = asyncio.Lock()
+
+
 @router.get("/metrics")
-def prometheus_metrics():
+async def prometheus_metrics():
     """
     Expose Prometheus metrics for scraping.
     """
-    data = generate_latest()
-    return Response(content=data, media_type=CONTENT_TYPE_LATEST)
+    if time.monotonic() - _METRICS_CACHE["ts"] > _METRICS_CACHE_TTL:
+        async with _METRICS_LOCK:
+            # Re-check under the lock so a herd regenerates once
+            if time.monotonic() - _METRICS_CACHE["ts"] > _METRICS_CACHE_TTL:
+                _METRICS_CACHE["data"] = generate_latest()
+                _METRICS_CACHE["ts"] = time.monotonic()
+    return Response(content=_METRICS_CACHE["data"], media_type=CONTENT_TYPE_LATEST)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from fastapi import APIRouter, HTTPException, status, Request
+from fastapi.responses import ORJSONResponse
 from opentelemetry import trace
+from pydantic import TypeAdapter
 
 from ..models.signal_models import AnomalySignal, RcaSignal
 from ..services.signal_store import add_anomaly, add_rca, get_recent_signals
@@ -16,8 +18,27 @@ tracer = trace.get_tracer(__name__)
 router = APIRouter(
     prefix="/signals",
     tags=["signals"],
+    # Explicit here (not just on the app) so /signals/recent batches are
+    # orjson-serialized no matter which app mounts the router
+    default_response_class=ORJSONResponse,
 )
 
+# Span attribute names, hoisted so the hot handlers load interned
+# globals instead of rebuilding the literals per request
+_ATTR_WINDOW_ID = "smartops.signal.windowId"
+_ATTR_SERVICE = "smartops.signal.service"
+_ATTR_TYPE = "smartops.signal.type"
+_ATTR_SCORE = "smartops.signal.score"
+_ATTR_IS_ANOMALY = "smartops.signal.isAnomaly"
+_ATTR_CONFIDENCE = "smartops.signal.confidence"
+_ATTR_CLIENT_IP = "http.client_ip"
+
+# Built once at import: TypeAdapter resolves the schema a single time,
+# and the list form amortizes that traversal across a whole batch
+# instead of per-model model_dump()/jsonable_encoder walks
+_ANOMALY_LIST_ADAPTER = TypeAdapter(List[AnomalySignal])
+_RCA_LIST_ADAPTER = TypeAdapter(List[RcaSignal])
+
 # ------------------------------------------------------------------------------
 # POST /signals/anomaly
 # ------------------------------------------------------------------------------
@@ -39,12 +60,17 @@ async def ingest_anomaly(signal: AnomalySignal, request: Request) -> Dict[str, A
     """
     with tracer.start_as_current_span("signals.ingest_anomaly") as span:
         try:
-            span.set_attribute("smartops.signal.windowId", signal.windowId)
-            span.set_attribute("smartops.signal.service", signal.service)
-            span.set_attribute("smartops.signal.type", signal.type.value)
-            span.set_attribute("smartops.signal.score", signal.score)
-            span.set_attribute("smartops.signal.isAnomaly", signal.isAnomaly)
-            span.set_attribute("http.client_ip", request.client.host)
+            # One batched call, and only when the span is actually
+            # recording — unsampled requests skip the bookkeeping
+            if span.is_recording():
+                span.set_attributes({
+                    _ATTR_WINDOW_ID: signal.windowId,
+                    _ATTR_SERVICE: signal.service,
+                    _ATTR_TYPE: signal.type,
+                    _ATTR_SCORE: signal.score,
+                    _ATTR_IS_ANOMALY: signal.isAnomaly,
+                    _ATTR_CLIENT_IP: request.client.host,
+                })
 
             # 1) Store signal
             add_anomaly(signal)
@@ -78,10 +104,13 @@ async def ingest_anomaly(signal: AnomalySignal, request: Request) -> Dict[str, A
 async def ingest_rca(signal: RcaSignal, request: Request) -> Dict[str, Any]:
     with tracer.start_as_current_span("signals.ingest_rca") as span:
         try:
-            span.set_attribute("smartops.signal.windowId", signal.windowId)
-            span.set_attribute("smartops.signal.service", signal.service or "")
-            span.set_attribute("smartops.signal.confidence", signal.confidence)
-            span.set_attribute("http.client_ip", request.client.host)
+            if span.is_recording():
+                span.set_attributes({
+                    _ATTR_WINDOW_ID: signal.windowId,
+                    _ATTR_SERVICE: signal.service or "",
+                    _ATTR_CONFIDENCE: signal.confidence,
+                    _ATTR_CLIENT_IP: request.client.host,
+                })
 
             add_rca(signal)
             await closed_loop_manager.enqueue_rca(signal)
@@ -113,8 +142,8 @@ async def list_recent(limit: int = 20) -> Dict[str, Any]:
         anomalies, rcas = get_recent_signals(limit=limit)
         return {
             "limit": limit,
-            "anomalies": anomalies,
-            "rcas": rcas,
+            "anomalies": _ANOMALY_LIST_ADAPTER.dump_python(anomalies),
+            "rcas": _RCA_LIST_ADAPTER.dump_python(rcas),
         }
     except Exception as exc:
         logger.exception("Failed to fetch recent signals")
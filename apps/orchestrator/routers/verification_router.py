@@ -87,7 +87,7 @@ async def verify_deployment(
             request.deployment = original_name
             result = await verify_deployment_rollout(request)
 
-            span.set_attribute("smartops.verification.status", result.status.value)
+            span.set_attribute("smartops.verification.status", result.status)
             span.set_attribute("smartops.replicas.desired", result.desired_replicas or -1)
             span.set_attribute("smartops.replicas.ready", result.ready_replicas or -1)
             return result
@@ -99,7 +99,7 @@ async def verify_deployment(
                     request.deployment = resolved_name
                     result = await verify_deployment_rollout(request)
 
-                    span.set_attribute("smartops.verification.status", result.status.value)
+                    span.set_attribute("smartops.verification.status", result.status)
                     span.set_attribute("smartops.replicas.desired", result.desired_replicas or -1)
                     span.set_attribute("smartops.replicas.ready", result.ready_replicas or -1)
                     return result
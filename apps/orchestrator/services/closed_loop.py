@@ -11,9 +11,9 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from opentelemetry import trace
 from prometheus_client import Counter, Gauge, Histogram
 
-from ..models.action_models import ActionRequest, ActionType, K8sTarget, ScaleParams
+from ..models.action_models import ActionRequest, ActionTypes, K8sTarget, ScaleParams
 from ..models.signal_models import AnomalySignal, RcaSignal
-from ..models.verification_models import VerificationStatus
+from ..models.verification_models import VerificationStatuses
 from ..services import orchestrator_service  # use execute_action()
 from ..services.k8s_core import list_deployments
 from ..utils.policy_client import PolicyDecisionType, check_policy
@@ -21,6 +21,10 @@ from ..utils.policy_client import PolicyDecisionType, check_policy
 logger = logging.getLogger("smartops.closed_loop")
 tracer = trace.get_tracer(__name__)
 
+# Enum member bound once: per-signal comparisons become an identity
+# check instead of an attribute lookup plus enum equality
+_ALLOW = PolicyDecisionType.ALLOW
+
 # --------------------------------------------------------------------------
 # Prometheus metrics
 # --------------------------------------------------------------------------
@@ -89,6 +93,13 @@ class QueueItem:
     signal: Union[AnomalySignal, RcaSignal]
     attempt: int = 0
     enqueued_at: float = field(default_factory=time.time)
+    # Resolved when the signal reaches a terminal outcome, so callers
+    # can await completion instead of sleeping a fixed interval. Carried
+    # across retries; set to None when nobody is waiting.
+    done: Optional["asyncio.Future[None]"] = None
+    # True when _process_item re-enqueued this item for a retry — the
+    # worker must then leave the future pending for the retry to resolve
+    rescheduled: bool = False
 
 
 # --------------------------------------------------------------------------
@@ -343,8 +354,9 @@ class ClosedLoopManager:
     # Enqueue
     # ---------------------------
 
-    async def enqueue_anomaly(self, signal: AnomalySignal) -> None:
-        item = QueueItem(kind="anomaly", signal=signal)
+    async def enqueue_anomaly(self, signal: AnomalySignal) -> "asyncio.Future[None]":
+        done: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        item = QueueItem(kind="anomaly", signal=signal, done=done)
         try:
             self.queue.put_nowait(item)
             CLOSED_LOOP_SIGNALS_TOTAL.labels(kind="anomaly", result="accepted").inc()
@@ -355,11 +367,14 @@ class ClosedLoopManager:
                 getattr(signal, "service", ""),
             )
             CLOSED_LOOP_SIGNALS_TOTAL.labels(kind="anomaly", result="dropped_queue_full").inc()
-            return
+            done.set_result(None)
+            return done
         CLOSED_LOOP_QUEUE_DEPTH.set(self.queue.qsize())
+        return done
 
-    async def enqueue_rca(self, signal: RcaSignal) -> None:
-        item = QueueItem(kind="rca", signal=signal)
+    async def enqueue_rca(self, signal: RcaSignal) -> "asyncio.Future[None]":
+        done: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        item = QueueItem(kind="rca", signal=signal, done=done)
         try:
             self.queue.put_nowait(item)
             CLOSED_LOOP_SIGNALS_TOTAL.labels(kind="rca", result="accepted").inc()
@@ -370,8 +385,10 @@ class ClosedLoopManager:
                 getattr(signal, "service", ""),
             )
             CLOSED_LOOP_SIGNALS_TOTAL.labels(kind="rca", result="dropped_queue_full").inc()
-            return
+            done.set_result(None)
+            return done
         CLOSED_LOOP_QUEUE_DEPTH.set(self.queue.qsize())
+        return done
 
     # ---------------------------
     # Worker loop
@@ -389,22 +406,28 @@ class ClosedLoopManager:
                 CLOSED_LOOP_DURATION_SECONDS.observe(time.time() - item.enqueued_at)
                 self.queue.task_done()
                 CLOSED_LOOP_QUEUE_DEPTH.set(self.queue.qsize())
+                # Terminal outcome (not a retry re-enqueue): wake waiters
+                if item.done is not None and not item.rescheduled and not item.done.done():
+                    item.done.set_result(None)
 
     # ---------------------------
     # Policy plan -> ActionRequest
     # ---------------------------
 
     def _action_request_from_policy_plan(self, plan: dict) -> ActionRequest:
+        # model_construct skips pydantic validation for these trusted
+        # internal objects (the plan comes from our own policy engine);
+        # defaults for the unset verify_* fields are still applied
         target_dict = plan["target"]
-        target = K8sTarget(
+        target = K8sTarget.model_construct(
             kind=target_dict["kind"],
             namespace=target_dict["namespace"],
             name=target_dict["name"],
         )
 
         if plan["type"] == "restart":
-            return ActionRequest(
-                type=ActionType.RESTART,
+            return ActionRequest.model_construct(
+                type=ActionTypes.RESTART,
                 target=target,
                 dry_run=plan.get("dry_run", False),
                 verify=plan.get("verify", True),
@@ -412,12 +435,12 @@ class ClosedLoopManager:
             )
 
         if plan["type"] == "scale":
-            return ActionRequest(
-                type=ActionType.SCALE,
+            return ActionRequest.model_construct(
+                type=ActionTypes.SCALE,
                 target=target,
                 dry_run=plan.get("dry_run", False),
                 verify=plan.get("verify", True),
-                scale=ScaleParams(replicas=plan["scale"]["replicas"]),
+                scale=ScaleParams.model_construct(replicas=plan["scale"]["replicas"]),
                 reason="Policy-engine decision",
             )
 
@@ -510,8 +533,10 @@ class ClosedLoopManager:
         self._maybe_refresh_config()
 
         with tracer.start_as_current_span("smartops.closed_loop.process_signal") as span:
-            span.set_attribute("smartops.signal.kind", item.kind)
-            span.set_attribute("smartops.signal.attempt", item.attempt)
+            span.set_attributes({
+                "smartops.signal.kind": item.kind,
+                "smartops.signal.attempt": item.attempt,
+            })
 
             raw = _safe_model_dict(item.signal)
             window_id = str(raw.get("windowId", ""))
@@ -577,14 +602,16 @@ class ClosedLoopManager:
                 return
 
             # record policy outcome metrics
-            decision_str = "allow" if policy_decision.decision == PolicyDecisionType.ALLOW else "deny"
+            decision_str = "allow" if policy_decision.decision is _ALLOW else "deny"
             reason_str = (policy_decision.reason or "").strip() or ("allowed" if decision_str == "allow" else "unknown")
             CLOSED_LOOP_POLICY_OUTCOMES_TOTAL.labels(kind=item.kind, decision=decision_str, reason=reason_str[:80]).inc()
 
-            if policy_decision.decision != PolicyDecisionType.ALLOW:
+            if policy_decision.decision is not _ALLOW:
                 logger.info("ClosedLoopManager: policy denied execution (%s)", policy_decision.reason)
-                span.set_attribute("smartops.policy.decision", "deny")
-                span.set_attribute("smartops.policy.reason", policy_decision.reason or "")
+                span.set_attributes({
+                    "smartops.policy.decision": "deny",
+                    "smartops.policy.reason": policy_decision.reason or "",
+                })
                 CLOSED_LOOP_SIGNALS_TOTAL.labels(kind=item.kind, result="policy_denied").inc()
                 return
 
@@ -594,10 +621,12 @@ class ClosedLoopManager:
                 return
 
             action_req = self._action_request_from_policy_plan(policy_decision.action_plan)
-            span.set_attribute("smartops.policy.decision", "allow")
-            span.set_attribute("smartops.policy.policy", getattr(policy_decision, "policy", "") or "")
+            span.set_attributes({
+                "smartops.policy.decision": "allow",
+                "smartops.policy.policy": getattr(policy_decision, "policy", "") or "",
+            })
 
-            action_type_label = action_req.type.value
+            action_type_label = action_req.type
             ns = action_req.target.namespace
             deployment_name = action_req.target.name
             now = time.time()
@@ -650,8 +679,12 @@ class ClosedLoopManager:
                         return
 
                 # scaling-specific guardrails
-                if action_req.type == ActionType.SCALE and action_req.scale is not None:
-                    current = self._get_current_replicas(ns, deployment_name)
+                if action_req.type == ActionTypes.SCALE and action_req.scale is not None:
+                    # Blocking kubernetes client call — run it off the
+                    # event loop so concurrent signals keep flowing
+                    current = await asyncio.to_thread(
+                        self._get_current_replicas, ns, deployment_name
+                    )
                     desired = action_req.scale.replicas
                     if current is not None:
                         delta = desired - current
@@ -745,7 +778,7 @@ class ClosedLoopManager:
             try:
                 logger.info(
                     "ClosedLoopManager: executing %s on %s/%s (attempt=%d windowId=%s)",
-                    action_req.type.value,
+                    action_req.type,
                     action_req.target.namespace,
                     action_req.target.name,
                     item.attempt,
@@ -760,12 +793,12 @@ class ClosedLoopManager:
 
                 verification = result.verification
                 if verification:
-                    verification_status_label = verification.status.value
+                    verification_status_label = verification.status
 
-                if result.success and verification and verification.status == VerificationStatus.SUCCESS:
+                if result.success and verification and verification.status == VerificationStatuses.SUCCESS:
                     # --- Production-grade: persist remediation state (prevents stage races) ---
                     try:
-                        if action_req.type.value == "scale":
+                        if action_req.type == ActionTypes.SCALE:
                             # action_req.scale.replicas is the target replicas
                             reps = None
                             if getattr(action_req, "scale", None) and getattr(action_req.scale, "replicas", None) is not None:
@@ -794,7 +827,7 @@ class ClosedLoopManager:
                         logger.exception("ClosedLoopManager: failed to persist remediation-level (best-effort).")
                     logger.info(
                         "ClosedLoopManager: action %s on %s/%s verified successfully in %.2fs",
-                        action_req.type.value,
+                        action_req.type,
                         action_req.target.namespace,
                         action_req.target.name,
                         action_duration,
@@ -803,7 +836,7 @@ class ClosedLoopManager:
                     logger.info(
                         "CLOSED_LOOP_SUMMARY | service=%s | action=%s | namespace=%s | duration=%.2fs | result=SUCCESS | attempt=%d | windowId=%s",
                         action_req.target.name,
-                        action_req.type.value,
+                        action_req.type,
                         action_req.target.namespace,
                         action_duration,
                         item.attempt + 1,
@@ -822,7 +855,7 @@ class ClosedLoopManager:
 
                 # decide retry
                 if verification:
-                    retry_allowed = verification.status in {VerificationStatus.TIMED_OUT}
+                    retry_allowed = verification.status in {VerificationStatuses.TIMED_OUT}
                 else:
                     retry_allowed = True
 
@@ -831,7 +864,7 @@ class ClosedLoopManager:
                     reason = "replica_guardrail_http_exception"
                     logger.warning(
                         "ClosedLoopManager: guardrail blocked action %s on %s/%s, dropping permanently",
-                        action_req.type.value,
+                        action_req.type,
                         action_req.target.namespace,
                         action_req.target.name,
                     )
@@ -844,7 +877,7 @@ class ClosedLoopManager:
                     logger.info(
                         "CLOSED_LOOP_SUMMARY | service=%s | action=%s | namespace=%s | duration=0.00s | result=GUARDRAIL_BLOCKED | attempt=%d | windowId=%s",
                         action_req.target.name,
-                        action_req.type.value,
+                        action_req.type,
                         action_req.target.namespace,
                         item.attempt + 1,
                         window_id,
@@ -881,9 +914,11 @@ class ClosedLoopManager:
                     signal=item.signal,
                     attempt=item.attempt + 1,
                     enqueued_at=item.enqueued_at,
+                    done=item.done,
                 )
                 try:
                     self.queue.put_nowait(retry_item)
+                    item.rescheduled = True
                 except asyncio.QueueFull:
                     logger.warning("ClosedLoopManager: queue full while scheduling retry for %s, dropping", key)
                 return
@@ -897,7 +932,7 @@ class ClosedLoopManager:
             logger.info(
                 "CLOSED_LOOP_SUMMARY | service=%s | action=%s | namespace=%s | duration=%.2fs | result=FAILED | attempt=%d | windowId=%s",
                 action_req.target.name,
-                action_req.type.value,
+                action_req.type,
                 action_req.target.namespace,
                 action_duration,
                 item.attempt + 1,
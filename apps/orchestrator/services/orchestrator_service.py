@@ -25,7 +25,7 @@ from ..models.action_models import (
     RestartRequest,
     ActionRequest,
     ActionResult,
-    ActionType,
+    ActionTypes,
 )
 from ..models.verification_models import DeploymentVerificationRequest
 from .verification_service import verify_deployment_rollout
@@ -406,7 +406,7 @@ async def execute_action(req: ActionRequest) -> ActionResult:
     target_str = _format_target(ns, resolved_name, kind)
 
     with tracer.start_as_current_span("orchestrator.actions.execute") as span:
-        span.set_attribute("smartops.action.type", req.type.value)
+        span.set_attribute("smartops.action.type", req.type)
         span.set_attribute("smartops.action.target", target_str)
         span.set_attribute("smartops.action.dry_run", req.dry_run)
         span.set_attribute("smartops.action.verify", req.verify)
@@ -419,7 +419,7 @@ async def execute_action(req: ActionRequest) -> ActionResult:
         verification = None
 
         # ---------------- SCALE ----------------
-        if req.type == ActionType.SCALE:
+        if req.type == ActionTypes.SCALE:
             if not req.scale:
                 raise HTTPException(400, "scale parameters are required for SCALE action")
 
@@ -478,14 +478,14 @@ async def execute_action(req: ActionRequest) -> ActionResult:
                 verification = await verify_deployment_rollout(vreq)
                 ver_duration = time.monotonic() - ver_start
 
-                span.set_attribute("smartops.verification.status", verification.status.value)
+                span.set_attribute("smartops.verification.status", verification.status)
 
                 # Verification metrics
                 _record_verification_metrics(
                     source=f"{source_base}_scale",
                     namespace=ns,
                     deployment=resolved_name,
-                    status=verification.status.value,
+                    status=verification.status,
                     duration_seconds=ver_duration,
                 )
 
@@ -503,7 +503,7 @@ async def execute_action(req: ActionRequest) -> ActionResult:
             )
 
         # ---------------- RESTART ----------------
-        elif req.type == ActionType.RESTART:
+        elif req.type == ActionTypes.RESTART:
             now_str = datetime.datetime.utcnow().isoformat() + "Z"
 
             result = action_runner.run(
@@ -546,14 +546,14 @@ async def execute_action(req: ActionRequest) -> ActionResult:
                 verification = await verify_deployment_rollout(vreq)
                 ver_duration = time.monotonic() - ver_start
 
-                span.set_attribute("smartops.verification.status", verification.status.value)
+                span.set_attribute("smartops.verification.status", verification.status)
 
                 # Verification metrics
                 _record_verification_metrics(
                     source=f"{source_base}_restart",
                     namespace=ns,
                     deployment=resolved_name,
-                    status=verification.status.value,
+                    status=verification.status,
                     duration_seconds=ver_duration,
                 )
 
@@ -571,7 +571,7 @@ async def execute_action(req: ActionRequest) -> ActionResult:
             )
 
         # ---------------- PATCH ----------------
-        elif req.type == ActionType.PATCH:
+        elif req.type == ActionTypes.PATCH:
             if not req.patch:
                 raise HTTPException(400, "patch parameters are required for PATCH action")
 
@@ -616,14 +616,14 @@ async def execute_action(req: ActionRequest) -> ActionResult:
                 verification = await verify_deployment_rollout(vreq)
                 ver_duration = time.monotonic() - ver_start
 
-                span.set_attribute("smartops.verification.status", verification.status.value)
+                span.set_attribute("smartops.verification.status", verification.status)
 
                 # Verification metrics
                 _record_verification_metrics(
                     source=f"{source_base}_patch",
                     namespace=ns,
                     deployment=resolved_name,
-                    status=verification.status.value,
+                    status=verification.status,
                     duration_seconds=ver_duration,
                 )
 
@@ -10,7 +10,7 @@ from opentelemetry import trace
 from ..models.verification_models import (
     DeploymentVerificationRequest,
     DeploymentVerificationResult,
-    VerificationStatus,
+    VerificationStatuses,
 )
 from ..services import k8s_core
 
@@ -99,7 +99,7 @@ async def verify_deployment_rollout(
         except Exception as exc:
             span.record_exception(exc)
             return DeploymentVerificationResult(
-                status=VerificationStatus.FAILED,
+                status=VerificationStatuses.FAILED,
                 message=f"Failed to read deployment status: {exc}",
                 namespace=ns,
                 deployment=request.deployment,
@@ -136,7 +136,7 @@ async def verify_deployment_rollout(
 
                 if not kpi_ok:
                     return DeploymentVerificationResult(
-                        status=VerificationStatus.FAILED,
+                        status=VerificationStatuses.FAILED,
                         message="Deployment rolled out but ERP KPIs did not recover.",
                         namespace=ns,
                         deployment=request.deployment,
@@ -147,7 +147,7 @@ async def verify_deployment_rollout(
                     )
 
             return DeploymentVerificationResult(
-                status=VerificationStatus.SUCCESS,
+                status=VerificationStatuses.SUCCESS,
                 message=f"Deployment rollout successful. Ready replicas: {ready}/{desired}.",
                 namespace=ns,
                 deployment=request.deployment,
@@ -159,7 +159,7 @@ async def verify_deployment_rollout(
 
         if rollout_result["status"] == "timeout":
             return DeploymentVerificationResult(
-                status=VerificationStatus.TIMED_OUT,
+                status=VerificationStatuses.TIMED_OUT,
                 message="Timed out waiting for deployment rollout.",
                 namespace=ns,
                 deployment=request.deployment,
@@ -170,7 +170,7 @@ async def verify_deployment_rollout(
             )
 
         return DeploymentVerificationResult(
-            status=VerificationStatus.FAILED,
+            status=VerificationStatuses.FAILED,
             message="Unexpected error during rollout verification.",
             namespace=ns,
             deployment=request.deployment,
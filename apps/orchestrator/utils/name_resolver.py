@@ -11,7 +11,7 @@ Resolution order:
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from kubernetes.client import ApiException
 
@@ -21,6 +21,19 @@ logger = logging.getLogger("smartops.name_resolver")
 
 SMARTOPS_PREFIX = "smartops-"
 
+# Successful resolutions only: the friendly-name -> real-name mapping is
+# static per process, so repeated /scale//restart//patch requests skip
+# the read_namespaced_deployment round-trips. Failures are NOT cached so
+# a deployment created later still resolves. A plain lru_cache would pin
+# the None results, which is why this is a manual dict.
+_RESOLUTION_CACHE: Dict[Tuple[str, str], str] = {}
+_RESOLUTION_CACHE_MAX = 512
+
+
+def clear_resolution_cache() -> None:
+    """Drop cached resolutions (e.g. after a config or namespace reload)."""
+    _RESOLUTION_CACHE.clear()
+
 
 def deployment_exists(name: str, namespace: str) -> bool:
     """
@@ -52,19 +65,31 @@ def resolve_deployment_name(name: str, namespace: str) -> Optional[str]:
 
     Returns resolved name if found, else None.
     """
+    key = (name, namespace)
+    cached = _RESOLUTION_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    resolved: Optional[str] = None
 
     # 1️⃣ Exact name (standalone Helm releases like odoo-web)
     if deployment_exists(name, namespace):
         logger.info("Resolved deployment using exact name: %s", name)
-        return name
-
-    # 2️⃣ SmartOps-prefixed name
-    prefixed = SMARTOPS_PREFIX + name
-    if deployment_exists(prefixed, namespace):
-        logger.info("Resolved deployment using prefixed name: %s", prefixed)
-        return prefixed
-
-    logger.warning(
-        "Deployment resolution failed: name='%s' namespace='%s'", name, namespace
-    )
-    return None
+        resolved = name
+    else:
+        # 2️⃣ SmartOps-prefixed name
+        prefixed = SMARTOPS_PREFIX + name
+        if deployment_exists(prefixed, namespace):
+            logger.info("Resolved deployment using prefixed name: %s", prefixed)
+            resolved = prefixed
+
+    if resolved is None:
+        logger.warning(
+            "Deployment resolution failed: name='%s' namespace='%s'", name, namespace
+        )
+        return None
+
+    if len(_RESOLUTION_CACHE) >= _RESOLUTION_CACHE_MAX:
+        _RESOLUTION_CACHE.clear()
+    _RESOLUTION_CACHE[key] = resolved
+    return resolved